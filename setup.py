@@ -92,6 +92,9 @@ setup(
         "setuptools >= 24.2.0",
     ],
     extras_require={
+        # orjson parses API responses and ijson streams large lists of
+        # hosts when they are installed.
+        "speedups": ["ijson", "orjson"],
         "test": [
             "coverage",
             # coveralls 1.11.0 added a service number for calls from
@@ -101,6 +104,8 @@ setup(
             # 1.11.1 fixed this issue, but to ensure expected behavior we'll pin
             # to never grab the regression version.
             "coveralls != 1.11.0",
+            "ijson",
+            "orjson",
             "pre-commit",
             "pytest-cov",
             "pytest",
@@ -2,45 +2,202 @@
 
 # Standard Python Libraries
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+# Third-Party Libraries
+from requests.models import Response
 
 # Custom Librares
 from .session import session
 
+try:
+    # Third-Party Libraries
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    # Standard Python Libraries
+    from json import dumps as _json_dumps  # type: ignore[assignment]
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+
+def _parse_json(response: Response) -> Any:
+    """Parse a response body, with orjson when it is installed."""
+    return _json_loads(response.content)
+
+
+def _dump_json(data: Any) -> Union[bytes, str]:
+    """Serialize a request body, with orjson when it is installed.
+
+    The session already sends "Content-Type: application/json", so the result
+    is passed to requests as data=.
+    """
+    return _json_dumps(data)
+
+
+@lru_cache(maxsize=None)
+def _load_ijson() -> Any:
+    """Import ijson on first use, or return None when it is not installed.
+
+    ijson takes longer to import than the rest of the package's own modules,
+    so only callers that stream a list response pay for it.
+    """
+    try:
+        # Third-Party Libraries
+        import ijson
+    except ImportError:  # pragma: no cover
+        return None
+
+    return ijson
+
+
+def _iter_json_items(response: Response) -> Iterator[Any]:
+    """Yield the items of a JSON array response requested with stream=True.
+
+    With ijson installed the items are parsed as the body arrives, otherwise
+    the whole body is read and parsed at once.
+    """
+    ijson: Any = _load_ijson()
+    if ijson is None:  # pragma: no cover
+        return iter(_parse_json(response))
+
+    # Let urllib3 undo any gzip/deflate encoding before ijson reads the body.
+    response.raw.decode_content = True
+    return ijson.items(response.raw, "item", use_float=True)
+
+
+EndpointType = TypeVar("EndpointType", bound="AbstractEndpoint")
+
+
+def _status_error_message(response: Response) -> str:
+    """Return the message for a status code an endpoint does not handle."""
+    return f"Error: {response.status_code} {response.reason}"
+
+
+def _serialize_value(value: Any) -> Any:
+    """Return a value that is already JSON serializable unchanged."""
+    return value
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an API timestamp in the 'YYYY-MM-DDTHH:MM:SS.SSSZ' format."""
+    # fromisoformat only accepts the Z suffix from Python 3.11.
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _serialize_datetime(value: Any) -> Any:
+    """Return a datetime in the API's 'YYYY-MM-DDTHH:MM:SS.SSSZ' format."""
+    if not isinstance(value, datetime):
+        return value
+
+    # Drop the offset so isoformat ends at the milliseconds, then add the Z.
+    return f'{value.replace(tzinfo=None).isoformat(timespec="milliseconds")}Z'
+
+
+def _attributes_to_dict(
+    endpoint: Any, exclude: FrozenSet[str] = frozenset()
+) -> Dict[str, Any]:
+    """Return an endpoint as a dictionary by walking its attributes."""
+    dictionary: Dict[str, Any] = {}
+    for attribute in endpoint.__dict__.keys():
+        if attribute in exclude:
+            continue
+
+        value: Any = getattr(endpoint, attribute)
+        # Checked in order of how often each type appears on the endpoints.
+        value_type: type = type(value)
+        if value_type is str:
+            if not attribute.startswith("__") and not attribute.endswith("path"):
+                dictionary[attribute] = value
+        elif value_type is bool or value_type is int or value_type is list:
+            dictionary[attribute] = value
+        elif isinstance(value, datetime):
+            dictionary[attribute] = _serialize_datetime(value)
+
+    return dictionary
+
+
+@lru_cache(maxsize=None)
+def _fields_without(
+    endpoint_class: Type["AbstractEndpoint"], exclude: FrozenSet[str]
+) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """Return an endpoint class's serializable fields less the excluded ones.
+
+    Cached per class and exclude set, so repeated to_dict calls only look up
+    the attributes left to serialize.
+    """
+    return tuple(
+        field
+        for field in endpoint_class._SERIALIZABLE_FIELDS
+        if field[0] not in exclude
+    )
+
 
 class AbstractEndpoint:
     """Abstract class for all Pentest.ws API endpoints."""
 
+    # Endpoints declare their own slots so instances carry no __dict__.
+    __slots__: Tuple[str, ...] = ()
+
     path: str = "https://pentest.ws/api/v1"
     pws_session = session
 
+    # (attribute, serializer) pairs sent to the API, declared by each endpoint.
+    _SERIALIZABLE_FIELDS: Tuple[Tuple[str, Callable[[Any], Any]], ...] = ()
+
     class Meta:
         """Class Meta data."""
 
         abstract = True
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Return object as dictionary."""
+    @classmethod
+    def _from_trusted_dict(
+        cls: Type[EndpointType], response: Dict[str, Any]
+    ) -> EndpointType:
+        """Build an endpoint from an API response without re-validating it.
+
+        The API has already validated the objects it returns, so this skips
+        the schema and assigns the attributes directly. Objects built by users
+        must still go through __init__.
+        """
+        endpoint: EndpointType = cls.__new__(cls)
+        for key, value in response.items():
+            setattr(endpoint, key, value)
+        endpoint._set_paths()
+
+        return endpoint
+
+    def _set_paths(self) -> None:
+        """Set the endpoint's API paths from its ids."""
+        pass
+
+    def to_dict(self, exclude: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+        """Return object as dictionary.
+
+        Args:
+            exclude (frozenset[str]): Attributes to leave out of the dictionary.
+        """
+        if not self._SERIALIZABLE_FIELDS:
+            return _attributes_to_dict(self, exclude)
+
         dictionary: Dict[str, Any] = {}
-        for attribute in self.__dict__.keys():
-            if isinstance(getattr(self, attribute), datetime):
-                time = datetime.strftime(
-                    getattr(self, attribute), "%Y-%m-%dT%H:%M:%S.%f"
-                )
-                # Strip last three digits of microseconds and add the Z.
-                time = f"{time[:-3]}Z"
-                dictionary[attribute] = time
-            elif (
-                isinstance(getattr(self, attribute), str)
-                and not attribute.startswith("__")
-                and not attribute.endswith("path")
-            ):
-                dictionary[attribute] = getattr(self, attribute)
-            elif (
-                isinstance(getattr(self, attribute), bool)
-                or isinstance(getattr(self, attribute), int)
-                or isinstance(getattr(self, attribute), list)
-            ):
-                dictionary[attribute] = getattr(self, attribute)
+        # Classes are hashable; the cast is for lru_cache's Hashable arguments.
+        endpoint_class: Hashable = cast(Hashable, type(self))
+        for attribute, serializer in _fields_without(endpoint_class, exclude):
+            value = getattr(self, attribute, None)
+            if value is not None:
+                dictionary[attribute] = serializer(value)
 
         return dictionary
@@ -0,0 +1,69 @@
+"""Caching helpers for the endpoints."""
+
+# Standard Python Libraries
+from functools import wraps
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+def ttl_cache(ttl: float, maxsize: int = 128) -> Callable:
+    """Cache a function's results for a limited time.
+
+    Results are keyed on the positional arguments and expire ``ttl`` seconds
+    after they are stored. Once ``maxsize`` results are held, the least
+    recently used one is dropped. The cache is safe to use from several
+    threads, though two threads missing on the same arguments at once may
+    both call the function. The wrapped function gains a
+    ``cache_clear()`` method to drop every stored result and a
+    ``cache_invalidate(*args)`` method to drop the result for one set of
+    arguments.
+
+    Args:
+        ttl (float): The number of seconds a result stays valid.
+        maxsize (int): The maximum number of results to keep.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        results: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        # Held while results is read or changed, but not while function runs.
+        lock: threading.Lock = threading.Lock()
+
+        @wraps(function)
+        def wrapper(*args: Hashable) -> Any:
+            now: float = time.monotonic()
+
+            with lock:
+                if args in results:
+                    stored_at, value = results.pop(args)
+                    if now - stored_at < ttl:
+                        # Re-insert to mark the result as the most recently used.
+                        results[args] = (stored_at, value)
+                        return value
+
+            value = function(*args)
+
+            with lock:
+                results[args] = (now, value)
+                if len(results) > maxsize:
+                    del results[next(iter(results))]
+
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                results.clear()
+
+        def cache_invalidate(*args: Hashable) -> None:
+            with lock:
+                results.pop(args, None)
+
+        wrapper.cache_clear = cache_clear  # type: ignore
+        wrapper.cache_invalidate = cache_invalidate  # type: ignore
+
+        return wrapper
+
+    return decorator
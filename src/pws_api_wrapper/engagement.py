@@ -4,13 +4,30 @@ from __future__ import annotations
 
 # Standard Python Libraries
 from datetime import datetime
-import json
 from typing import Any
 
 # Third-Party Libraries
 from requests.models import Response
 
-from .abstract_endpoint import AbstractEndpoint
+from .abstract_endpoint import (
+    AbstractEndpoint,
+    _dump_json,
+    _parse_datetime,
+    _parse_json,
+    _serialize_datetime,
+    _serialize_value,
+    _status_error_message,
+)
+from .cache import ttl_cache
+
+# Seconds a cached list of engagements is reused before it is fetched again.
+ENGAGEMENT_CACHE_TTL: float = 30.0
+
+
+class EngagementNotFoundError(Exception):
+    """Exception for an Engagement name that does not exist in pentest.ws."""
+
+    pass
 
 
 class Engagement(AbstractEndpoint):
@@ -33,6 +50,19 @@ class Engagement(AbstractEndpoint):
 
     path: str = f"{AbstractEndpoint.path}/e"
 
+    _SERIALIZABLE_FIELDS = (
+        ("id", _serialize_value),
+        ("name", _serialize_value),
+        ("notes", _serialize_value),
+        ("client_id", _serialize_value),
+        ("created_at", _serialize_datetime),
+        ("archived", _serialize_datetime),
+    )
+    __slots__ = tuple(field for field, _ in _SERIALIZABLE_FIELDS) + ("engagement_path",)
+
+    # Attributes the API does not accept on update.
+    _UPDATE_EXCLUDE: frozenset[str] = frozenset({"id", "created_at", "archived"})
+
     def __init__(
         self,
         name: str,
@@ -54,47 +84,49 @@ class Engagement(AbstractEndpoint):
         """
         if id != "":
             self.id: str = id
+            self.engagement_path: str = f"{self.path}/{self.id}"
 
         self.name: str = name
         self.notes: str = notes
         self.client_id: str = client_id
 
         if created_at != "" and created_at is not None:
-            self.created_at: datetime = datetime.strptime(
-                created_at.replace("Z", "+0000"), "%Y-%m-%dT%H:%M:%S.%f%z"
-            )
+            self.created_at: datetime = _parse_datetime(created_at)
 
         if archived != "" and archived is not None:
-            self.archived: datetime = datetime.strptime(
-                archived.replace("Z", "+0000"), "%Y-%m-%dT%H:%M:%S.%f%z"
-            )
+            self.archived: datetime = _parse_datetime(archived)
 
     def delete(self) -> str:
         """Delete an Engagement by name from pentest.ws API."""
-        response: Response = Engagement.pws_session.delete(f"{self.path}/{self.id}")
+        response: Response = Engagement.pws_session.delete(self.engagement_path)
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
+            Engagement.cache_clear()
             message: str = f"Engagement {self.name} ({self.id}) deleted."
         elif response.status_code == 404:
             message = f"Error: Engagement {self.name} ({self.id}) not found"
+        else:
+            message = _status_error_message(response)
 
         return message
 
     def create(self) -> str:
         """Create an Engagement in pentest.ws."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
         response: Response = self.pws_session.post(
-            self.path, headers=self.pws_session.headers, data=json.dumps(self.to_dict())
+            self.path, data=_dump_json(self.to_dict())
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
-            self.id = response.json()["id"]
+            self.id = _parse_json(response)["id"]
+            self.engagement_path = f"{self.path}/{self.id}"
+            Engagement.cache_clear()
             message: str = f"Engagement {self.name} ({self.id}) created."
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
 
@@ -105,50 +137,74 @@ class Engagement(AbstractEndpoint):
         # TODO Custom Exception (Issue 1)
         response: Response = Engagement.pws_session.get(f"{Engagement.path}/{eid}")
 
-        return Engagement(**response.json())
+        return Engagement(**_parse_json(response))
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop the cached engagements so the next lookup hits the API."""
+        Engagement._get_all.cache_clear()  # type: ignore
+        Engagement._get_eids.cache_clear()  # type: ignore
 
     @staticmethod
     def get_all() -> list[dict[str, Any]]:
-        """Get all Engagements."""
+        """Get all Engagements.
+
+        The response is cached for ENGAGEMENT_CACHE_TTL seconds, and each call
+        returns a copy of it, so local changes are not seen by other callers.
+        """
+        return [dict(engagement) for engagement in Engagement._get_all()]
+
+    @staticmethod
+    @ttl_cache(ttl=ENGAGEMENT_CACHE_TTL)
+    def _get_all() -> list[dict[str, Any]]:
+        """Get all Engagements from the API, bypassing the cache."""
         # TODO Custom Exception (Issue 1)
         response: Response = Engagement.pws_session.get(Engagement.path)
 
-        return response.json()
+        return _parse_json(response)
 
     @staticmethod
     def get_eid(name: str) -> str:
-        """Get Engagement ID based on Name."""
-        # TODO Handled multiple Engagements with the same name
-        engagements: list[dict[str, Any]] = Engagement.get_all()
+        """Get Engagement ID based on Name.
 
-        # TODO Custom Exception (Issue 1)
-        eid: str = list(
-            filter(lambda engagement: engagement["name"] == name, engagements)
-        )[0]["id"]
+        Raises:
+            EngagementNotFoundError: No Engagement has the name.
+        """
+        eid: str | None = Engagement._get_eids().get(name)
+        if eid is None:
+            raise EngagementNotFoundError(f"Engagement {name} not found.")
 
         return eid
 
+    @staticmethod
+    @ttl_cache(ttl=ENGAGEMENT_CACHE_TTL)
+    def _get_eids() -> dict[str, str]:
+        """Map each Engagement name to its ID."""
+        eids: dict[str, str] = {}
+        # TODO Handled multiple Engagements with the same name
+        for engagement in Engagement._get_all():
+            # Keep the first Engagement with a name, as get_eid always has.
+            eids.setdefault(engagement["name"], engagement["id"])
+
+        return eids
+
     def update(self) -> str:
         """Update an Engagement."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
-        data = self.to_dict()
-        # TODO Make these field meta data.
-        del data["id"]
-        del data["created_at"]
-        del data["archived"]
+        data = self.to_dict(exclude=self._UPDATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.put(
-            f"{self.path}/{self.id}",
-            headers=self.pws_session.headers,
-            data=json.dumps(data),
+            self.engagement_path,
+            data=_dump_json(data),
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
+            Engagement.cache_clear()
             message: str = f"Engagement {self.name} ({self.id}) updated."
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
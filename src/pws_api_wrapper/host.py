@@ -3,19 +3,35 @@
 from __future__ import annotations
 
 # Standard Python Libraries
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import ip_address
-import json
-import re
 import sys
-from typing import Any
+from typing import Any, Callable
 
 # Third-Party Libraries
 from requests import exceptions as requests_exceptions
 from requests.models import Response
-from schema import And, Optional, Or, Regex, Schema, SchemaError, Use
+from schema import And, Optional, Or, Schema, SchemaError, Use
 
 # Customer Libraries
-from .abstract_endpoint import AbstractEndpoint
+from .abstract_endpoint import (
+    AbstractEndpoint,
+    _dump_json,
+    _iter_json_items,
+    _parse_json,
+    _serialize_value,
+    _status_error_message,
+)
+from .port import Port
+from .session import MAX_WORKERS
+from .validators import (
+    is_bool,
+    is_id,
+    is_one_of,
+    is_str,
+    is_str_or_none,
+    quick_validate,
+)
 
 OS_TYPES: list[tuple[str, str]] = [
     ("Android", "Android"),
@@ -39,6 +55,53 @@ TYPES: list[tuple[str, str]] = [
     ("desktop", "Workstation"),
 ]
 
+# Both the API value and its display name are accepted, mapped to the API value.
+_OS_TYPE_VALUES: dict[str, str] = {
+    **{value: value for value, _ in OS_TYPES},
+    **{label: value for value, label in OS_TYPES},
+}
+_TYPE_VALUES: dict[str, str] = {
+    **{value: value for value, _ in TYPES},
+    **{label: value for value, label in TYPES},
+}
+
+
+def _is_ipv4(value: Any) -> bool:
+    """Return True for a dotted-quad IPv4 address already in canonical form."""
+    if type(value) is not str:
+        return False
+
+    octets: list[str] = value.split(".")
+    if len(octets) != 4:
+        return False
+
+    for octet in octets:
+        # Leading zeros and non-ASCII digits are left to ip_address to reject.
+        if not (octet.isascii() and octet.isdigit()) or len(octet) > 3:
+            return False
+        if octet[0] == "0" and len(octet) > 1:
+            return False
+        if int(octet) > 255:
+            return False
+
+    return True
+
+
+def _canonical_ip(value: str) -> str:
+    """Return an IP address in canonical form.
+
+    Canonical IPv4 addresses, the common case, are returned as they are
+    without building an ipaddress object; anything else, IPv6 included, goes
+    through ip_address.
+
+    Raises:
+        ValueError: The value is not a valid IP address.
+    """
+    if _is_ipv4(value):
+        return value
+
+    return str(ip_address(value))
+
 
 class Host(AbstractEndpoint):
     """Host Objects for Pentest.ws API.
@@ -62,86 +125,119 @@ class Host(AbstractEndpoint):
 
     """
 
+    _SERIALIZABLE_FIELDS = (
+        ("board_id", _serialize_value),
+        ("eid", _serialize_value),
+        ("flagged", _serialize_value),
+        ("hostnames", _serialize_value),
+        ("id", _serialize_value),
+        ("label", _serialize_value),
+        ("notes", _serialize_value),
+        ("os", _serialize_value),
+        ("os_type", _serialize_value),
+        ("out_of_scope", _serialize_value),
+        ("owned", _serialize_value),
+        ("reviewed", _serialize_value),
+        ("shell", _serialize_value),
+        ("target", _serialize_value),
+        ("thumbs_down", _serialize_value),
+        ("thumbs_up", _serialize_value),
+        ("type", _serialize_value),
+    )
+    __slots__ = tuple(field for field, _ in _SERIALIZABLE_FIELDS) + (
+        "engagement_path",
+        "host_path",
+    )
+
+    # Attributes the API does not accept on create.
+    _CREATE_EXCLUDE: frozenset[str] = frozenset({"eid"})
+    # Attributes the API does not accept on update.
+    _UPDATE_EXCLUDE: frozenset[str] = frozenset({"id", "eid"})
+
+    _SCHEMA: Schema = Schema(
+        {
+            Optional("board_id"): And(
+                str,
+                is_id,
+                error='"board_id" should be 8 alphanumeric characters',
+            ),
+            Optional("eid"): And(
+                str,
+                is_id,
+                error='"eid" should be 8 alphanumeric characters',
+            ),
+            Optional("flagged"): And(
+                bool, error='"flagged" should be True/False boolean'
+            ),
+            Optional("hostnames"): And(str, error='"hostnames" should be a string'),
+            Optional("id"): And(
+                str,
+                is_id,
+                error='"id" should be 8 alphanumeric characters',
+            ),
+            Optional("label"): Or(And(str, error='"label" should be a string.'), None),
+            Optional("notes"): Or(And(str, error='"notes" should be a string'), None),
+            Optional("os"): Or(And(str, error='"os" should be a string'), None),
+            Optional("os_type"): And(
+                str,
+                _OS_TYPE_VALUES.__contains__,
+                error='Not a valid "os_type".',
+            ),
+            Optional("out_of_scope"): And(
+                bool, error='"out_of_scope" should be True/False boolean'
+            ),
+            Optional("owned"): And(bool, error='"owned" should be True/False boolean'),
+            Optional("reviewed"): And(
+                bool, error='"reviewed" should be True/False boolean'
+            ),
+            Optional("shell"): And(bool, error='"shell" should be True/False boolean'),
+            "target": And(
+                str,
+                Use(_canonical_ip),
+                error="Target should be a valid IPv4 Address",
+            ),
+            Optional("thumbs_down"): And(
+                bool, error='"thumbs_down" should be True/False boolean'
+            ),
+            Optional("thumbs_up"): And(
+                bool, error='"thumbs_up" should be True/False boolean'
+            ),
+            Optional("type"): And(
+                str,
+                _TYPE_VALUES.__contains__,
+                error='Not a valid "type".',
+            ),
+        }
+    )
+
+    # Only canonical IPv4 targets pass, as _canonical_ip returns them unchanged.
+    _CHECKS: dict[str, Callable[[Any], bool]] = {
+        "board_id": is_id,
+        "eid": is_id,
+        "flagged": is_bool,
+        "hostnames": is_str,
+        "id": is_id,
+        "label": is_str_or_none,
+        "notes": is_str_or_none,
+        "os": is_str_or_none,
+        "os_type": is_one_of(frozenset(_OS_TYPE_VALUES)),
+        "out_of_scope": is_bool,
+        "owned": is_bool,
+        "reviewed": is_bool,
+        "shell": is_bool,
+        "target": _is_ipv4,
+        "thumbs_down": is_bool,
+        "thumbs_up": is_bool,
+        "type": is_one_of(frozenset(_TYPE_VALUES)),
+    }
+    _REQUIRED: frozenset[str] = frozenset({"target"})
+
     def __init__(self, **kwargs):
         """Initialize host object."""
-        schema: Schema = Schema(
-            {
-                Optional("board_id"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"board_id" should be 8 alphanumeric characters',
-                ),
-                Optional("eid"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"eid" should be 8 alphanumeric characters',
-                ),
-                Optional("flagged"): And(
-                    bool, error='"flagged" should be True/False boolean'
-                ),
-                Optional("hostnames"): And(str, error='"hostnames" should be a string'),
-                Optional("id"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"id" should be 8 alphanumeric characters',
-                ),
-                Optional("label"): Or(
-                    And(str, error='"label" should be a string.'), None
-                ),
-                Optional("notes"): Or(
-                    And(str, error='"notes" should be a string'), None
-                ),
-                Optional("os"): Or(And(str, error='"os" should be a string'), None),
-                Optional("os_type"): And(
-                    str,
-                    Or(
-                        lambda submitted_os_type: submitted_os_type
-                        in [os_type[0] for os_type in OS_TYPES],
-                        lambda submitted_os_type: submitted_os_type
-                        in [os_type[1] for os_type in OS_TYPES],
-                        OS_TYPES,
-                    ),  # TODO Create a schema hook.
-                    error='Not a valid "os_type".',
-                ),
-                Optional("out_of_scope"): And(
-                    bool, error='"out_of_scope" should be True/False boolean'
-                ),
-                Optional("owned"): And(
-                    bool, error='"owned" should be True/False boolean'
-                ),
-                Optional("reviewed"): And(
-                    bool, error='"reviewed" should be True/False boolean'
-                ),
-                Optional("shell"): And(
-                    bool, error='"shell" should be True/False boolean'
-                ),
-                "target": And(
-                    str,
-                    Use(lambda ip: str(ip_address(ip))),
-                    error="Target should be a valid IPv4 Address",
-                ),
-                Optional("thumbs_down"): And(
-                    bool, error='"thumbs_down" should be True/False boolean'
-                ),
-                Optional("thumbs_up"): And(
-                    bool, error='"thumbs_up" should be True/False boolean'
-                ),
-                Optional("type"): And(
-                    str,
-                    Or(
-                        lambda submitted_type: submitted_type
-                        in [type[0] for type in TYPES],
-                        lambda submitted_type: submitted_type
-                        in [type[1] for type in TYPES],
-                        TYPES,
-                    ),  # TODO Create a schema hook.
-                    error='Not a valid "type".',
-                ),
-            }
-        )
-
         try:
-            validated_args: dict[str, Any] = schema.validate(kwargs)
+            validated_args: dict[str, Any] = quick_validate(
+                Host._SCHEMA, Host._CHECKS, Host._REQUIRED, kwargs
+            )
         except SchemaError as err:
             # Raise error because 1 or more items were invald.
             print(err, file=sys.stderr)
@@ -150,42 +246,89 @@ class Host(AbstractEndpoint):
         for key, value in validated_args.items():
             setattr(self, key, value)
 
-        try:
+        self._set_paths()
+
+    def _set_paths(self) -> None:
+        """Set the host and engagement API paths from the ids."""
+        if getattr(self, "id", None):
             self.host_path: str = f"{AbstractEndpoint.path}/hosts/{self.id}"
-        except AttributeError:
-            pass
 
-        if self.eid:
-            self.engagement_path: str = f"{AbstractEndpoint.path}/e/{self.eid}/hosts"
+        eid: str | None = getattr(self, "eid", None)
+        if eid:
+            self.engagement_path: str = f"{AbstractEndpoint.path}/e/{eid}/hosts"
 
-    def create(self) -> str:
-        """Create an Host in pentest.ws."""
-        self.pws_session.headers["Content-Type"] = "application/json"
+    @staticmethod
+    def canonical_os_type(os_type: str) -> str:
+        """Return the API value for an "os_type" value or display name.
 
-        # Convert to dict to remove eid before json dump, API does not accept eid.
-        host_dict: dict = self.to_dict()
-        del host_dict["eid"]  # Drop eid as the API does not accept it.
+        Raises:
+            KeyError: The os_type is not valid.
+        """
+        return _OS_TYPE_VALUES[os_type]
 
-        host_data: str = json.dumps(host_dict)
+    @staticmethod
+    def canonical_type(type: str) -> str:
+        """Return the API value for a "type" value or display name.
+
+        Raises:
+            KeyError: The type is not valid.
+        """
+        return _TYPE_VALUES[type]
+
+    @staticmethod
+    def bulk_create(hosts: list[Host]) -> list[str]:
+        """Create many Hosts in pentest.ws concurrently.
+
+        The requests share the session's connection pool, so at most
+        MAX_WORKERS of them are in flight at once.
+
+        Args:
+            hosts (list[Host]): The hosts to create.
+
+        Returns:
+            list[str]: The create message for each host, in order.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(lambda host: host.create(), hosts))
+
+    @staticmethod
+    def bulk_get(hids: list[str]) -> list[Host]:
+        """Get many hosts from the API concurrently.
+
+        Args:
+            hids (list[str]): The ids of the hosts to get.
+
+        Returns:
+            list[Host]: The hosts, in the order of hids.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(Host.get, hids))
+
+    def create(self) -> str:
+        """Create an Host in pentest.ws."""
+        host_dict: dict = self.to_dict(exclude=self._CREATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.post(
-            self.engagement_path, headers=self.pws_session.headers, data=host_data
+            self.engagement_path, data=_dump_json(host_dict)
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
-            self.id = response.json()["id"]
+            self.id = _parse_json(response)["id"]
+            self.host_path = f"{AbstractEndpoint.path}/hosts/{self.id}"
             # FIXME The next line is flagged by mypy for Host not having an attribute "target".
             message: str = f"Host {self.target} ({self.id}) created."  # type: ignore
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
 
     def delete(self) -> str:
         """Delete a host by id from pentest.ws API."""
-        response: Response = self.pws_session.delete(f"{self.host_path}")
+        response: Response = self.pws_session.delete(self.host_path)
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
@@ -194,6 +337,8 @@ class Host(AbstractEndpoint):
         elif response.status_code == 404:
             # FIXME The next line is flagged by mypy for Host not having an attribute "target".
             message = f"Error: Host {self.target} ({self.id}) not found"  # type: ignore
+        else:
+            message = _status_error_message(response)
 
         return message
 
@@ -209,36 +354,57 @@ class Host(AbstractEndpoint):
         except requests_exceptions.HTTPError as err:
             raise SystemExit(err)
         else:
-            return Host(**response.json())
+            return Host._from_trusted_dict(_parse_json(response))
 
     @staticmethod
     def get_all(eid: str) -> list[Host]:
         """Get all hosts from an Engagements."""
         # TODO Custom Exception (Issue 1)
         response: Response = Host.pws_session.get(
-            f"{AbstractEndpoint.path}/e/{eid}/hosts"
+            f"{AbstractEndpoint.path}/e/{eid}/hosts", stream=True
         )
-        hosts: list[Host] = list()
 
-        for host_response in response.json():
-            hosts.append(Host(**host_response))
+        with response:
+            try:
+                response.raise_for_status()
+            except requests_exceptions.HTTPError as err:
+                raise SystemExit(err)
+
+            return [
+                Host._from_trusted_dict(host_response)
+                for host_response in _iter_json_items(response)
+            ]
+
+    @staticmethod
+    def get_all_with_ports(eid: str) -> list[tuple[Host, list[Port]]]:
+        """Get all hosts from an Engagement along with each host's ports.
+
+        The ports for every host are fetched concurrently, with at most
+        MAX_WORKERS requests in flight at once.
+
+        Args:
+            eid (str): The id of the engagement.
 
-        return hosts
+        Returns:
+            list[tuple[Host, list[Port]]]: Each host paired with its ports.
+        """
+        hosts: list[Host] = Host.get_all(eid)
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            ports: list[list[Port]] = list(
+                executor.map(lambda host: Port.get_all(host.id), hosts)
+            )
+
+        return list(zip(hosts, ports))
 
     def update(self) -> str:
         """Update a Host."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
-        data = self.to_dict()
-        # TODO Make these field meta data.
-        del data["id"]
-        del data["eid"]
+        data = self.to_dict(exclude=self._UPDATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.put(
-            f"{self.host_path}",
-            headers=self.pws_session.headers,
-            data=json.dumps(data),
+            self.host_path,
+            data=_dump_json(data),
         )
 
         # TODO Custom Exception (Issue 1)
@@ -246,6 +412,8 @@ class Host(AbstractEndpoint):
             # FIXME The next line is flagged by mypy for Host not having an attribute "target".
             message: str = f"Host {self.target} ({self.id}) updated."  # type: ignore
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
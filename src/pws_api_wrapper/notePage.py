@@ -3,21 +3,38 @@
 from __future__ import annotations
 
 # Standard Python Libraries
-import json
-import re
 import sys
-from typing import Any
+from typing import Any, Callable
 
 # Third-Party Libraries
 from requests import exceptions as requests_exceptions
 from requests.models import Response
-from schema import And, Optional, Or, Regex, Schema, SchemaError
+from schema import And, Optional, Or, Schema, SchemaError
 
 # Customer Libraries
-from .abstract_endpoint import AbstractEndpoint
+from .abstract_endpoint import (
+    AbstractEndpoint,
+    _dump_json,
+    _parse_json,
+    _serialize_value,
+    _status_error_message,
+)
+from .cache import ttl_cache
+from .validators import (
+    is_id,
+    is_one_of,
+    is_str_or_none,
+    is_title,
+    quick_validate,
+)
+
+# Seconds a cached Note Page is reused before it is fetched again.
+NOTEPAGE_CACHE_TTL: float = 30.0
 
 OBJECT_TYPES: list[str] = ["e", "hosts", "ports"]
 
+_OBJECT_TYPES_SET: frozenset[str] = frozenset(OBJECT_TYPES)
+
 
 class NotePage(AbstractEndpoint):
     """NotePage Objects fro Pentest.ws API.
@@ -31,45 +48,65 @@ class NotePage(AbstractEndpoint):
 
     """
 
+    _SERIALIZABLE_FIELDS = (
+        ("content", _serialize_value),
+        ("id", _serialize_value),
+        ("oid", _serialize_value),
+        ("otype", _serialize_value),
+        ("title", _serialize_value),
+    )
+    __slots__ = tuple(field for field, _ in _SERIALIZABLE_FIELDS) + (
+        "notepad_path",
+        "object_path",
+    )
+
+    # Attributes the API does not accept on update.
+    _UPDATE_EXCLUDE: frozenset[str] = frozenset({"id", "oid", "otype"})
+
+    _SCHEMA: Schema = Schema(
+        {
+            Optional("content"): Or(
+                str, None, error='"contented" should be a string or None.'
+            ),
+            Optional("id"): And(
+                str,
+                is_id,
+                error='"id" should be 8 alphanumeric characters',
+            ),
+            # TODO Make oid and otype both required when one is present.
+            Optional("oid"): And(
+                str,
+                is_id,
+                error='"oid" should be 8 alphanumeric characters',
+            ),
+            Optional("otype"): And(
+                str,
+                _OBJECT_TYPES_SET.__contains__,
+                error=f'"otype" should be one of the following: {str(OBJECT_TYPES)[1:-1]}',
+            ),
+            "title": And(
+                str,
+                is_title,
+                error='Note Page "title" is required.',
+            ),
+        }
+    )
+
+    _CHECKS: dict[str, Callable[[Any], bool]] = {
+        "content": is_str_or_none,
+        "id": is_id,
+        "oid": is_id,
+        "otype": is_one_of(_OBJECT_TYPES_SET),
+        "title": is_title,
+    }
+    _REQUIRED: frozenset[str] = frozenset({"title"})
+
     def __init__(self, **kwargs):
         """Initialize note page object."""
-        schema: Schema = Schema(
-            {
-                Optional("content"): Or(
-                    str, None, error='"contented" should be a string or None.'
-                ),
-                Optional("id"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"id" should be 8 alphanumeric characters',
-                ),
-                # TODO Make oid and otype both required when one is present.
-                Optional("oid"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"oid" should be 8 alphanumeric characters',
-                ),
-                Optional("otype"): And(
-                    str,
-                    Or(
-                        lambda submitted_otype: submitted_otype
-                        in [otype[0] for otype in OBJECT_TYPES],
-                        lambda submitted_os_type: submitted_os_type
-                        in [otype[1] for otype in OBJECT_TYPES],
-                        OBJECT_TYPES,
-                    ),  # TODO Create a schema hook.
-                    error=f'"otype" should be one of the following: {str(OBJECT_TYPES)[1:-1]}',
-                ),
-                "title": And(
-                    str,
-                    Regex(r"[a-zA-Z0-9]+", flags=re.IGNORECASE),
-                    error='Note Page "title" is required.',
-                ),
-            }
-        )
-
         try:
-            validated_args: dict[str, Any] = schema.validate(kwargs)
+            validated_args: dict[str, Any] = quick_validate(
+                NotePage._SCHEMA, NotePage._CHECKS, NotePage._REQUIRED, kwargs
+            )
         except SchemaError as err:
             # Raise error because 1 or more items were invalid.
             print(err, file=sys.stderr)
@@ -78,58 +115,78 @@ class NotePage(AbstractEndpoint):
         for key, value in validated_args.items():
             setattr(self, key, value)
 
-        try:
+        self._set_paths()
+
+    def _set_paths(self) -> None:
+        """Set the note page and object API paths from the ids."""
+        if getattr(self, "id", None):
             # If a notePad ID, oid, and otype is provided, creates the notePad_path.
             self.notepad_path: str = f"{AbstractEndpoint.path}/notepages/{self.id}"
-        except AttributeError:
-            pass
 
-        if self.oid and self.otype:
+        oid: str | None = getattr(self, "oid", None)
+        otype: str | None = getattr(self, "otype", None)
+        if oid and otype:
             # Creates and object_path if oid and otype are provided.
-            self.object_path: str = (
-                f"{AbstractEndpoint.path}/{self.otype}/{self.oid}/notepages"
-            )
+            self.object_path: str = f"{AbstractEndpoint.path}/{otype}/{oid}/notepages"
 
     def create(self) -> str:
         """Create a Note Pad in pentest.ws."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
         notepad_dict: dict = self.to_dict()
 
-        notepad_data: str = json.dumps(notepad_dict)
-
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.post(
-            self.object_path, headers=self.pws_session.headers, data=notepad_data
+            self.object_path, data=_dump_json(notepad_dict)
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
-            self.id = response.json()["id"]
+            self.id = _parse_json(response)["id"]
+            self.notepad_path = f"{AbstractEndpoint.path}/notepages/{self.id}"
             # FIXME The next line is flagged by mypy for NotePage not having an attribute "title".
             message: str = f"Note Page {self.title} ({self.id}) created."  # type: ignore
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
 
     def delete(self) -> str:
         """Delete a note page by id from pentest.ws API."""
-        response: Response = self.pws_session.delete(f"{self.notepad_path}")
+        response: Response = self.pws_session.delete(self.notepad_path)
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
+            NotePage._get.cache_invalidate(self.id)  # type: ignore
             # FIXME The next line is flagged by mypy for Host not having an attribute "title".
             message: str = f"Note Page {self.title} ({self.id}) deleted."  # type: ignore
         elif response.status_code == 404:
             # FIXME The next line is flagged by mypy for Host not having an attribute "title".
             message = f"Error: Note Page {self.title} ({self.id}) not found."  # type: ignore
+        else:
+            message = _status_error_message(response)
 
         return message
 
     @staticmethod
     def get(id: str) -> NotePage:
-        """Get a Note Page from the API."""
+        """Get a Note Page from the API.
+
+        The API response is cached for NOTEPAGE_CACHE_TTL seconds, and each
+        call builds a new Note Page from it, so local changes are not seen by
+        other callers.
+        """
+        return NotePage._from_trusted_dict(dict(NotePage._get(id)))
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop the cached Note Pages so the next lookup hits the API."""
+        NotePage._get.cache_clear()  # type: ignore
+
+    @staticmethod
+    @ttl_cache(ttl=NOTEPAGE_CACHE_TTL, maxsize=1024)
+    def _get(id: str) -> dict[str, Any]:
+        """Get a Note Page's API response, bypassing the cache."""
         # TODO Custom Exception (Issue 1)
         try:
             response: Response = NotePage.pws_session.get(
@@ -139,30 +196,26 @@ class NotePage(AbstractEndpoint):
         except requests_exceptions.HTTPError as err:
             raise SystemExit(err)
         else:
-            return NotePage(**response.json())
+            return _parse_json(response)
 
     def update(self) -> str:
         """Update a Note Page."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
-        data = self.to_dict()
-        # TODO Make these field meta data.
-        del data["id"]
-        del data["oid"]
-        del data["otype"]
+        data = self.to_dict(exclude=self._UPDATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.put(
-            f"{self.notepad_path}",
-            headers=self.pws_session.headers,
-            data=json.dumps(data),
+            self.notepad_path,
+            data=_dump_json(data),
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
+            NotePage._get.cache_invalidate(self.id)  # type: ignore
             # FIXME Flagged by mypy for not having an attribute "title".
             message: str = f"Note Page {self.title} ({self.id}) updated."  # type: ignore
         elif response.status_code == 404:
             message = f"Error: {response.reason}"
+        else:
+            message = _status_error_message(response)
 
         return message
@@ -3,18 +3,34 @@
 from __future__ import annotations
 
 # Standard Python Libraries
-import json
-import re
+import copy
 import sys
-from typing import Any
+from typing import Any, Callable
 
 # Third-Party Libraries
 from requests import exceptions as requests_exceptions
 from requests.models import Response
-from schema import And, Optional, Or, Regex, Schema, SchemaError
+from schema import And, Optional, Or, Schema, SchemaError
 
 # Customer Libraries
-from .abstract_endpoint import AbstractEndpoint
+from .abstract_endpoint import (
+    AbstractEndpoint,
+    _dump_json,
+    _iter_json_items,
+    _parse_json,
+    _serialize_value,
+    _status_error_message,
+)
+from .cache import ttl_cache
+from .validators import (
+    is_id,
+    is_one_of_or_none,
+    is_str_or_none,
+    quick_validate,
+)
+
+# Seconds a cached port is reused before it is fetched again.
+PORT_CACHE_TTL: float = 30.0
 
 PROTOCOLS: list[str] = ["tcp", "udp"]
 STATUSES: list[str] = ["Needs Review", "Vulnerable", "Checked", "Owned"]
@@ -27,6 +43,22 @@ STATES: list[str] = [
     "closed|filtered",
 ]
 
+_PROTOCOLS_SET: frozenset[str] = frozenset(PROTOCOLS)
+_STATUSES_SET: frozenset[str] = frozenset(STATUSES)
+_STATES_SET: frozenset[str] = frozenset(STATES)
+
+
+def _is_port(value: Any) -> bool:
+    """Return True for an integer port number, excluding booleans."""
+    return type(value) is int and 0 <= value <= 65535
+
+
+def _is_checklist(value: Any) -> bool:
+    """Return True for None or a list of dictionaries."""
+    return value is None or (
+        type(value) is list and all(type(item) is dict for item in value)
+    )
+
 
 class Port(AbstractEndpoint):
     """Port Objects for Pentest.ws API.
@@ -45,59 +77,92 @@ class Port(AbstractEndpoint):
 
     """
 
+    _SERIALIZABLE_FIELDS = (
+        ("checklist", _serialize_value),
+        ("hid", _serialize_value),
+        ("id", _serialize_value),
+        ("port", _serialize_value),
+        ("proto", _serialize_value),
+        ("service", _serialize_value),
+        ("status", _serialize_value),
+        ("state", _serialize_value),
+        ("notes", _serialize_value),
+        ("version", _serialize_value),
+    )
+    __slots__ = tuple(field for field, _ in _SERIALIZABLE_FIELDS) + (
+        "host_path",
+        "port_path",
+    )
+
+    # Attributes the API does not accept on create.
+    _CREATE_EXCLUDE: frozenset[str] = frozenset({"hid"})
+    # Attributes the API does not accept on update.
+    _UPDATE_EXCLUDE: frozenset[str] = frozenset({"id", "hid", "port"})
+
+    _SCHEMA: Schema = Schema(
+        {
+            Optional("checklist"): Or(
+                And(list, [dict, {str, str}]),
+                None,
+                error='"checklist" should be a list of dictionaries.',
+            ),
+            Optional("hid"): And(
+                str,
+                is_id,
+                error='"hid" should be 8 alphanumeric characters',
+            ),
+            Optional("id"): And(
+                str,
+                is_id,
+                error='"id" should be 8 alphanumeric characters',
+            ),
+            "port": And(
+                _is_port,
+                error='"port" should be an intiger between 0 and 65,535.',
+            ),
+            Optional("proto"): Or(  # TODO Create a schema hook.
+                And(str, _PROTOCOLS_SET.__contains__),
+                And(None),
+                error='"proto" should be "tcp", "udp", or None',
+            ),
+            Optional("service"): Or(str, None, error='"service" should be a string.'),
+            Optional("status"): Or(  # TODO Create a schema hook.
+                And(str, _STATUSES_SET.__contains__),
+                And(None),
+                error='Not a valid "status".',
+            ),
+            Optional("state"): Or(  # TODO Create a schema hook.
+                And(str, _STATES_SET.__contains__),
+                And(None),
+                error='Not a valid "state".',
+            ),
+            Optional("notes"): Or(And(str, error='"notes" should be a string'), None),
+            Optional("version"): Or(
+                And(str, error='"version" should be a string'), None
+            ),
+        }
+    )
+
+    _CHECKS: dict[str, Callable[[Any], bool]] = {
+        "checklist": _is_checklist,
+        "hid": is_id,
+        "id": is_id,
+        "port": _is_port,
+        "proto": is_one_of_or_none(_PROTOCOLS_SET),
+        "service": is_str_or_none,
+        "status": is_one_of_or_none(_STATUSES_SET),
+        "state": is_one_of_or_none(_STATES_SET),
+        "notes": is_str_or_none,
+        "version": is_str_or_none,
+    }
+    _REQUIRED: frozenset[str] = frozenset({"port"})
+
     def __init__(self, **kwargs):
         """Initialize port object."""
-        schema: Schema = Schema(
-            {
-                Optional("checklist"): Or(
-                    And(list, [dict, {str, str}]),
-                    None,
-                    error='"checklist" should be a list of dictionaries.',
-                ),
-                Optional("hid"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"hid" should be 8 alphanumeric characters',
-                ),
-                Optional("id"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"id" should be 8 alphanumeric characters',
-                ),
-                "port": And(
-                    int,
-                    lambda submitted_port: 0 <= submitted_port <= 65535,
-                    error='"port" should be an intiger between 0 and 65,535.',
-                ),
-                Optional("proto"): Or(  # TODO Create a schema hook.
-                    And(str, lambda submitted_proto: submitted_proto in PROTOCOLS),
-                    And(None),
-                    error='"proto" should be "tcp", "udp", or None',
-                ),
-                Optional("service"): Or(
-                    str, None, error='"service" should be a string.'
-                ),
-                Optional("status"): Or(  # TODO Create a schema hook.
-                    And(str, lambda submitted_status: submitted_status in STATUSES),
-                    And(None),
-                    error='Not a valid "status".',
-                ),
-                Optional("state"): Or(  # TODO Create a schema hook.
-                    And(str, lambda submitted_stat: submitted_stat in STATES),
-                    And(None),
-                    error='Not a valid "state".',
-                ),
-                Optional("notes"): Or(
-                    And(str, error='"notes" should be a string'), None
-                ),
-                Optional("version"): Or(
-                    And(str, error='"version" should be a string'), None
-                ),
-            }
-        )
-
         try:
-            validated_args: dict[str, Any] = schema.validate(kwargs)
+            validated_args: dict[str, Any] = quick_validate(
+                Port._SCHEMA, Port._CHECKS, Port._REQUIRED, kwargs
+            )
         except SchemaError as err:
             # Raise error because 1 or more items were invald.
             print(err, file=sys.stderr)
@@ -106,56 +171,76 @@ class Port(AbstractEndpoint):
         for key, value in validated_args.items():
             setattr(self, key, value)
 
-        try:
+        self._set_paths()
+
+    def _set_paths(self) -> None:
+        """Set the port and host API paths from the ids."""
+        if getattr(self, "id", None):
             self.port_path: str = f"{AbstractEndpoint.path}/ports/{self.id}"
-        except AttributeError:
-            pass
 
-        if self.hid:
-            self.host_path: str = f"{AbstractEndpoint.path}/hosts/{self.hid}/ports"
+        hid: str | None = getattr(self, "hid", None)
+        if hid:
+            self.host_path: str = f"{AbstractEndpoint.path}/hosts/{hid}/ports"
 
     def create(self) -> str:
         """Create an Port in pentest.ws."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
-        # Convert to dict to remove hid before json dump, API does not accept hid.
-        port_dict: dict = self.to_dict()
-        del port_dict["hid"]  # Drop hid as the API does not accept it.
-
-        port_data: str = json.dumps(port_dict)
+        port_dict: dict = self.to_dict(exclude=self._CREATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.post(
-            self.host_path, headers=self.pws_session.headers, data=port_data
+            self.host_path, data=_dump_json(port_dict)
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
-            self.id = response.json()["id"]
+            self.id = _parse_json(response)["id"]
+            self.port_path = f"{AbstractEndpoint.path}/ports/{self.id}"
             # FIXME The next line is flagged by mypy for Port not having an attribute "port".
             message: str = f"Port {self.port} ({self.id}) created."  # type: ignore
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
 
     def delete(self) -> str:
         """Delete a port by id from pentest.ws API."""
-        response: Response = self.pws_session.delete(f"{self.port_path}")
+        response: Response = self.pws_session.delete(self.port_path)
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
+            Port._get.cache_invalidate(self.id)  # type: ignore
             # FIXME The next line is flagged by mypy for Port not having an attribute "port".
             message: str = f"Port {self.port} ({self.id}) deleted."  # type: ignore
         elif response.status_code == 404:
             # FIXME The next line is flagged by mypy for Port not having an attribute "port".
             message = f"Error: Port {self.port} ({self.id}) not found"  # type: ignore
+        else:
+            message = _status_error_message(response)
 
         return message
 
     @staticmethod
     def get(pid: str) -> Port:
-        """Get a port from the API.."""
+        """Get a port from the API.
+
+        The API response is cached for PORT_CACHE_TTL seconds, and each call
+        builds a new Port from it, so local changes are not seen by other
+        callers.
+        """
+        # Deep copy, as the checklist is a list of dicts.
+        return Port._from_trusted_dict(copy.deepcopy(Port._get(pid)))
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop the cached ports so the next lookup hits the API."""
+        Port._get.cache_clear()  # type: ignore
+
+    @staticmethod
+    @ttl_cache(ttl=PORT_CACHE_TTL, maxsize=1024)
+    def _get(pid: str) -> dict[str, Any]:
+        """Get a port's API response, bypassing the cache."""
         # TODO Custom Exception (Issue 1)
         try:
             response: Response = Port.pws_session.get(
@@ -165,45 +250,45 @@ class Port(AbstractEndpoint):
         except requests_exceptions.HTTPError as err:
             raise SystemExit(err)
         else:
-            return Port(**response.json())
+            return _parse_json(response)
 
     @staticmethod
     def get_all(hid: str) -> list[Port]:
         """Get all ports from a Host."""
         # TODO Custom Exception (Issue 1)
         response: Response = Port.pws_session.get(
-            f"{AbstractEndpoint.path}/hosts/{hid}/ports"
+            f"{AbstractEndpoint.path}/hosts/{hid}/ports", stream=True
         )
-        ports: list[Port] = list()
 
-        for host_response in response.json():
-            ports.append(Port(**host_response))
+        with response:
+            try:
+                response.raise_for_status()
+            except requests_exceptions.HTTPError as err:
+                raise SystemExit(err)
 
-        return ports
+            return [
+                Port._from_trusted_dict(port_response)
+                for port_response in _iter_json_items(response)
+            ]
 
     def update(self) -> str:
         """Update a Port."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
-        data = self.to_dict()
-        # TODO Make these field meta data.
-        del data["id"]
-        del data["hid"]
-
-        del data["port"]
+        data = self.to_dict(exclude=self._UPDATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.put(
-            f"{self.port_path}",
-            headers=self.pws_session.headers,
-            data=json.dumps(data),
+            self.port_path,
+            data=_dump_json(data),
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
+            Port._get.cache_invalidate(self.id)  # type: ignore
             # FIXME The next line is flagged by mypy for Port not having an attribute "port".
             message: str = f"Port {self.port} ({self.id}) updated."  # type: ignore
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
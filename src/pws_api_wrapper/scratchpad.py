@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 # Standard Python Libraries
-import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 import sys
-from typing import Any
+from typing import Any, Callable
 
 # Third-Party Libraries
 from requests import exceptions as requests_exceptions
 from requests.models import Response
-from schema import And, Optional, Or, Regex, Schema, SchemaError
+from schema import And, Optional, Or, Schema, SchemaError
 
 # Customer Libraries
-from .abstract_endpoint import AbstractEndpoint
+from .abstract_endpoint import (
+    AbstractEndpoint,
+    _dump_json,
+    _iter_json_items,
+    _parse_json,
+    _serialize_value,
+    _status_error_message,
+)
+from .session import MAX_WORKERS
+from .validators import (
+    is_id,
+    is_one_of_or_none,
+    is_str_or_none,
+    is_title,
+    quick_validate,
+)
 
 LANGUAGES = [
     "abap",
@@ -172,6 +186,15 @@ LANGUAGES = [
 
 TYPES = ["code", "rich"]
 
+_LANGUAGES_SET: frozenset[str] = frozenset(LANGUAGES)
+_TYPES_SET: frozenset[str] = frozenset(TYPES)
+
+# Schema error messages listing the accepted values.
+_TYPE_ERROR: str = f'"type" should be None or one of the following: {str(TYPES)[1:-1]}'
+_LANGUAGE_ERROR: str = (
+    f'"language" should be None or one of the following: {str(LANGUAGES)[1:-1]}'
+)
+
 
 class Scratchpad(AbstractEndpoint):
     """Scratchpad Objects for Pentest.ws API.
@@ -186,45 +209,75 @@ class Scratchpad(AbstractEndpoint):
 
     """
 
+    _SERIALIZABLE_FIELDS = (
+        ("hid", _serialize_value),
+        ("id", _serialize_value),
+        ("title", _serialize_value),
+        ("type", _serialize_value),
+        ("language", _serialize_value),
+        ("content", _serialize_value),
+    )
+    __slots__ = tuple(field for field, _ in _SERIALIZABLE_FIELDS) + (
+        "host_path",
+        "scratchpad_path",
+    )
+
+    # Path prefixes, built once rather than for every scratchpad.
+    _SCRATCHPADS_PATH: str = f"{AbstractEndpoint.path}/scratchpads"
+    _HOSTS_PATH: str = f"{AbstractEndpoint.path}/hosts"
+
+    # Attributes the API does not accept on update.
+    _UPDATE_EXCLUDE: frozenset[str] = frozenset({"id", "hid"})
+
+    _SCHEMA: Schema = Schema(
+        {
+            Optional("hid"): And(
+                str,
+                is_id,
+                error='"hid" should be 8 alphanumeric characters',
+            ),
+            Optional("id"): And(
+                str,
+                is_id,
+                error='"id" should be 8 alphanumeric characters',
+            ),
+            "title": And(
+                str,
+                is_title,
+                error='Scratchpad "title" is required.',
+            ),
+            Optional("type"): Or(
+                And(str, _TYPES_SET.__contains__),
+                And(None),
+                error=_TYPE_ERROR,
+            ),
+            Optional("language"): Or(
+                And(str, _LANGUAGES_SET.__contains__),
+                And(None),
+                error=_LANGUAGE_ERROR,
+            ),
+            Optional("content"): Or(
+                str, None, error='"contented" should be a string or None.'
+            ),
+        }
+    )
+
+    _CHECKS: dict[str, Callable[[Any], bool]] = {
+        "hid": is_id,
+        "id": is_id,
+        "title": is_title,
+        "type": is_one_of_or_none(_TYPES_SET),
+        "language": is_one_of_or_none(_LANGUAGES_SET),
+        "content": is_str_or_none,
+    }
+    _REQUIRED: frozenset[str] = frozenset({"title"})
+
     def __init__(self, **kwargs):
         """Initialize scratchpad object."""
-        schema: Schema = Schema(
-            {
-                Optional("hid"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"hid" should be 8 alphanumeric characters',
-                ),
-                Optional("id"): And(
-                    str,
-                    Regex(r"^[a-zA-Z0-9]{8,}$", flags=re.IGNORECASE),
-                    error='"id" should be 8 alphanumeric characters',
-                ),
-                "title": And(
-                    str,
-                    Regex(r"[a-zA-Z0-9]+", flags=re.IGNORECASE),
-                    error='Scratchpad "title" is required.',
-                ),
-                Optional("type"): Or(
-                    And(str, lambda submitted_type: submitted_type in TYPES),
-                    And(None),
-                    error=f'"type" should be None or one of the following: {str(TYPES)[1:-1]}',
-                ),
-                Optional("language"): Or(
-                    And(
-                        str, lambda submitted_language: submitted_language in LANGUAGES
-                    ),
-                    And(None),
-                    error=f'"language" should be None or one of the following: {str(LANGUAGES)[1:-1]}',
-                ),
-                Optional("content"): Or(
-                    str, None, error='"contented" should be a string or None.'
-                ),
-            }
-        )
-
         try:
-            validated_args: dict[str, Any] = schema.validate(kwargs)
+            validated_args: dict[str, Any] = quick_validate(
+                Scratchpad._SCHEMA, Scratchpad._CHECKS, Scratchpad._REQUIRED, kwargs
+            )
         except SchemaError as err:
             # Raise error because 1 or more items were invalid.
             print(err, file=sys.stderr)
@@ -233,44 +286,44 @@ class Scratchpad(AbstractEndpoint):
         for key, value in validated_args.items():
             setattr(self, key, value)
 
-        try:
+        self._set_paths()
+
+    def _set_paths(self) -> None:
+        """Set the scratchpad and host API paths from the ids."""
+        if getattr(self, "id", None):
             # If a scratchpad ID is provided, creates the scratchpad_path.
-            self.scratchpad_path: str = f"{AbstractEndpoint.path}/scratchpads/{self.id}"
-        except AttributeError:
-            pass
+            self.scratchpad_path: str = f"{self._SCRATCHPADS_PATH}/{self.id}"
 
-        if self.hid:
+        hid: str | None = getattr(self, "hid", None)
+        if hid:
             # Create a new scratchpad or get the all scratchpads for host ID.
-            self.host_path: str = (
-                f"{AbstractEndpoint.path}/hosts/{self.hid}/scratchpads"
-            )
+            self.host_path: str = f"{self._HOSTS_PATH}/{hid}/scratchpads"
 
     def create(self) -> str:
         """Create an Scratchpad in pentest.ws."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
         scratchpad_dict: dict = self.to_dict()
 
-        scratchpad_data: str = json.dumps(scratchpad_dict)
-
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.post(
-            self.host_path, headers=self.pws_session.headers, data=scratchpad_data
+            self.host_path, data=_dump_json(scratchpad_dict)
         )
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
-            self.id = response.json()["id"]
+            self.id = _parse_json(response)["id"]
+            self.scratchpad_path = f"{self._SCRATCHPADS_PATH}/{self.id}"
             # FIXME The next line is flagged by mypy for Host not having an attribute "target".
             message: str = f"Scratchpad {self.title} ({self.id}) created."  # type: ignore
         elif response.status_code == 400:
-            message = f"Error: {response.json()['msg']}"
+            message = f"Error: {_parse_json(response)['msg']}"
+        else:
+            message = _status_error_message(response)
 
         return message
 
     def delete(self) -> str:
         """Delete a scratchpad by id from pentest.ws API."""
-        response: Response = self.pws_session.delete(f"{self.scratchpad_path}")
+        response: Response = self.pws_session.delete(self.scratchpad_path)
 
         # TODO Custom Exception (Issue 1)
         if response.status_code == 200:
@@ -279,51 +332,65 @@ class Scratchpad(AbstractEndpoint):
         elif response.status_code == 404:
             # FIXME The next line is flagged by mypy for Host not having an attribute "title".
             message = f"Error: Scratchpad {self.title} ({self.id}) not found"  # type: ignore
+        else:
+            message = _status_error_message(response)
 
         return message
 
+    @staticmethod
+    def bulk_get(ids: list[str]) -> list[Scratchpad]:
+        """Get many scratchpads from the API concurrently.
+
+        Args:
+            ids (list[str]): The ids of the scratchpads to get.
+
+        Returns:
+            list[Scratchpad]: The scratchpads, in the order of ids.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(Scratchpad.get, ids))
+
     @staticmethod
     def get(id: str) -> Scratchpad:
         """Get a scratchpad from the API."""
         # TODO Custom Exception (Issue 1)
         try:
             response: Response = Scratchpad.pws_session.get(
-                f"{AbstractEndpoint.path}/scratchpads/{id}"
+                f"{Scratchpad._SCRATCHPADS_PATH}/{id}"
             )
             response.raise_for_status()
         except requests_exceptions.HTTPError as err:
             raise SystemExit(err)
         else:
-            return Scratchpad(**response.json())
+            return Scratchpad._from_trusted_dict(_parse_json(response))
 
     @staticmethod
     def get_all(hid: str) -> list[Scratchpad]:
         """Get all scratchpads from a Host."""
         # TODO Custom Exception (Issue 1)
         response: Response = Scratchpad.pws_session.get(
-            f"{AbstractEndpoint.path}/hosts/{hid}/scratchpads"
+            f"{Scratchpad._HOSTS_PATH}/{hid}/scratchpads", stream=True
         )
-        scratchpads: list[Scratchpad] = list()
 
-        for scratchpad_response in response.json():
-            scratchpads.append(Scratchpad(**scratchpad_response))
+        with response:
+            try:
+                response.raise_for_status()
+            except requests_exceptions.HTTPError as err:
+                raise SystemExit(err)
 
-        return scratchpads
+            return [
+                Scratchpad._from_trusted_dict(scratchpad_response)
+                for scratchpad_response in _iter_json_items(response)
+            ]
 
     def update(self) -> str:
         """Update a Scratchpad."""
-        self.pws_session.headers["Content-Type"] = "application/json"
-
-        data = self.to_dict()
-        # TODO Make these field meta data.
-        del data["id"]
-        del data["hid"]
+        data = self.to_dict(exclude=self._UPDATE_EXCLUDE)
 
         # TODO Custom Exception (Issue 1)
         response: Response = self.pws_session.put(
-            f"{self.scratchpad_path}",
-            headers=self.pws_session.headers,
-            data=json.dumps(data),
+            self.scratchpad_path,
+            data=_dump_json(data),
         )
 
         # TODO Custom Exception (Issue 1)
@@ -333,5 +400,7 @@ class Scratchpad(AbstractEndpoint):
         elif response.status_code == 400:
 
             message = f"Error: {response.reason}"
+        else:
+            message = _status_error_message(response)
 
         return message
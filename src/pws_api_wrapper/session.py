@@ -6,6 +6,14 @@ import os
 # Third-Party Libraries
 # Third Party Libraries
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool sizes for the shared session's adapter.
+POOL_CONNECTIONS: int = 10
+POOL_MAXSIZE: int = 20
+# Worker threads used by the bulk helpers, kept within the pool size.
+MAX_WORKERS: int = 10
 
 
 class APIKeyMissingError(Exception):
@@ -34,7 +42,58 @@ def get_api_key():
     return PENTEST_WS_API_KEY
 
 
-session: requests.Session = requests.Session()
-session.headers = requests.structures.CaseInsensitiveDict()
-session.headers["X-API-KEY"] = get_api_key()
-session.headers["accept"] = "application/json"
+class APIKeyAuth(requests.auth.AuthBase):
+    """Attach the pentest.ws API key to each request.
+
+    The key is read when a request is prepared rather than when the package is
+    imported, so importing does not require PENTEST_WS_API_KEY to be set.
+    """
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        """Add the X-API-KEY header to the request.
+
+        Raises:
+            APIKeyMissingError: Alerts on missing API Key.
+        """
+        request.headers["X-API-KEY"] = get_api_key()
+        return request
+
+
+def build_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """Build the session shared by all of the endpoints.
+
+    The session mounts a pooled adapter so keep-alive connections (and their
+    TLS sessions) are reused across API calls, and retries idempotent
+    requests that fail with a transient status code.
+
+    Args:
+        pool_maxsize (int): The most connections kept open to pentest.ws.
+            Raise it when running more concurrent requests than MAX_WORKERS.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retries: Retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+
+    pws_session: requests.Session = requests.Session()
+    pws_session.mount("https://", adapter)
+    pws_session.auth = APIKeyAuth()
+    # Keep requests' default headers, which ask for keep-alive connections and
+    # gzip/deflate compressed responses.
+    pws_session.headers["accept"] = "application/json"
+    pws_session.headers["Content-Type"] = "application/json"
+
+    return pws_session
+
+
+session: requests.Session = build_session()
@@ -0,0 +1,90 @@
+"""Validators shared by the endpoint schemas."""
+
+# Standard Python Libraries
+import re
+from typing import Any, Callable, Dict, FrozenSet
+
+# Third-Party Libraries
+from schema import Schema
+
+# Pentest.ws ids are at least 8 alphanumeric characters. \Z rather than $ so a
+# trailing newline is rejected, and the class already covers both cases.
+ID_PATTERN: re.Pattern = re.compile(r"^[a-zA-Z0-9]{8,}\Z")
+
+# Titles only need one alphanumeric character, so search stops at the first.
+TITLE_PATTERN: re.Pattern = re.compile(r"[a-zA-Z0-9]")
+
+
+def is_id(value: Any) -> bool:
+    """Return True for a string matching ID_PATTERN."""
+    return type(value) is str and ID_PATTERN.match(value) is not None
+
+
+def is_title(value: Any) -> bool:
+    """Return True for a string with at least one alphanumeric character."""
+    return type(value) is str and TITLE_PATTERN.search(value) is not None
+
+
+def is_bool(value: Any) -> bool:
+    """Return True for True or False."""
+    return type(value) is bool
+
+
+def is_str(value: Any) -> bool:
+    """Return True for a string."""
+    return type(value) is str
+
+
+def is_str_or_none(value: Any) -> bool:
+    """Return True for a string or None."""
+    return value is None or type(value) is str
+
+
+def is_one_of(values: FrozenSet[str]) -> Callable[[Any], bool]:
+    """Return a check for a string in values."""
+
+    def check(value: Any) -> bool:
+        return type(value) is str and value in values
+
+    return check
+
+
+def is_one_of_or_none(values: FrozenSet[str]) -> Callable[[Any], bool]:
+    """Return a check for None or a string in values."""
+
+    def check(value: Any) -> bool:
+        return value is None or (type(value) is str and value in values)
+
+    return check
+
+
+def quick_validate(
+    schema: Schema,
+    checks: Dict[str, Callable[[Any], bool]],
+    required: FrozenSet[str],
+    data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Validate data with plain checks, falling back to the schema.
+
+    Every check must only accept values the schema also accepts unchanged, so
+    the result matches schema.validate. The schema is only run for data that
+    may be invalid, where it raises its usual SchemaError.
+
+    Args:
+        schema (Schema): The schema the checks mirror.
+        checks (dict[str, Callable]): A check for each key the schema allows.
+        required (frozenset[str]): The keys the schema requires.
+        data (dict[str, Any]): The data to validate.
+
+    Raises:
+        SchemaError: The data is not valid.
+
+    Returns:
+        dict[str, Any]: The validated data.
+    """
+    if required <= data.keys() and all(
+        key in checks and checks[key](value) for key, value in data.items()
+    ):
+        return dict(data)
+
+    return schema.validate(data)
@@ -2,11 +2,118 @@
 
 https://docs.pytest.org/en/latest/writing_plugins.html#conftest-py-plugins
 """
+# Standard Python Libraries
+import copy
+import io
+
 # Third-Party Libraries
 import pytest
+from requests.models import Response
+import vcr
+from vcr.persisters.filesystem import FilesystemPersister
 
 # Custom Libraries
 from pws_api_wrapper.engagement import Engagement
+from pws_api_wrapper.notePage import NotePage
+from pws_api_wrapper.port import Port
+from pws_api_wrapper.session import session
+
+# Test data shared by the fixtures below. Each fixture returns a copy, so tests
+# can add or delete keys without affecting one another.
+ENGAGEMENT_DICT_NO_ARCHIVED = {
+    "id": "7aBB7za9",
+    "name": "Engagement 1",
+    "notes": "<strong>Test 1</strong>",
+    "client_id": "",
+    "created_at": "2021-02-05T19:59:27.104Z",
+}
+
+ENGAGEMENT_DICT_NO_CREATED_AT = {
+    "id": "7aBB7za9",
+    "name": "Engagement 1",
+    "notes": "<strong>Test 1</strong>",
+    "client_id": "",
+    "archived": "2021-02-05T19:59:27.104Z",
+}
+
+HOST_DICT = {
+    "target": "1.2.3.4",
+    "board_id": "abcd1234",
+    "eid": "ZaAvk46j",
+    "flagged": True,
+    "hostnames": "host",
+    "id": "No3e25l6",
+    "label": "label",
+    "notes": "Note",
+    "os": "OS",
+    "os_type": "Linux",
+    "out_of_scope": True,
+    "owned": False,
+    "reviewed": True,
+    "shell": True,
+    "thumbs_down": True,
+    "thumbs_up": True,
+    "type": "Unknown",
+}
+
+NOTEPAGE_DICT = {
+    "id": "1ab5Mqoy",
+    "oid": "46yEw36g",
+    "otype": "e",
+    "title": "Engagement Test Note",
+    "content": "Some text is here.",
+}
+
+PORT_DICT = {
+    "id": "56VqkKba",
+    "hid": "za4AlEP6",
+    "port": 22,
+    "proto": "tcp",
+    "service": "SSH",
+    "version": "2.3",
+    "status": "Needs Review",
+    "state": "open",
+    "notes": "Some Notes",
+    "checklist": [{"0": "Log In?"}],
+}
+
+SCRATCHPAD_DICT = {
+    "id": "1abWR16y",
+    "hid": "za4AlEP6",
+    "title": "README.md",
+    "type": "code",
+    "language": "markdown",
+    "content": "`hash:user``",
+}
+
+
+class CachingPersister(FilesystemPersister):
+    """Read and parse each VCR cassette once per test session.
+
+    Several tests replay the same cassette, so later loads reuse the parsed
+    interactions instead of reading and parsing the YAML again.
+    """
+
+    _cassettes: dict = {}
+
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        """Return the cassette's requests and responses, parsing it once."""
+        key = (str(cassette_path), serializer)
+        if key not in cls._cassettes:
+            cls._cassettes[key] = super().load_cassette(cassette_path, serializer)
+        requests, responses = cls._cassettes[key]
+        # New lists, so a cassette that records cannot change the cached ones.
+        return list(requests), list(responses)
+
+    @classmethod
+    def save_cassette(cls, cassette_path, cassette_dict, serializer):
+        """Write the cassette and drop its cached copy."""
+        cls._cassettes.pop((str(cassette_path), serializer), None)
+        super().save_cassette(cassette_path, cassette_dict, serializer)
+
+
+vcr.default_vcr.register_persister(CachingPersister)
 
 
 def pytest_addoption(parser):
@@ -32,31 +139,60 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_slow)
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep cached API responses from leaking between tests."""
+    Engagement.cache_clear()
+    NotePage.cache_clear()
+    Port.cache_clear()
+
+
+@pytest.fixture
+def server_error(monkeypatch):
+    """Make every API call return a 500 Internal Server Error."""
+    response = Response()
+    response.status_code = 500
+    response.reason = "Internal Server Error"
+    monkeypatch.setattr(session, "request", lambda *args, **kwargs: response)
+
+
+@pytest.fixture
+def not_found(monkeypatch):
+    """Make every API call return a 404 Not Found with an error message."""
+    response = Response()
+    response.status_code = 404
+    response.reason = "Not Found"
+    response.raw = io.BytesIO(b'{"msg":"Invalid Engagement ID"}')
+    monkeypatch.setattr(session, "request", lambda *args, **kwargs: response)
+
+
+@pytest.fixture
+def sent_requests(monkeypatch):
+    """Record each prepared request the session sends, then send it."""
+    sent = []
+    send = session.send
+
+    def record_send(request, **kwargs):
+        sent.append(request)
+        return send(request, **kwargs)
+
+    monkeypatch.setattr(session, "send", record_send)
+    return sent
+
+
 @pytest.fixture
 def engagement_dict_no_archived():
     """Return an Engagement Dictionary."""
-    return {
-        "id": "7aBB7za9",
-        "name": "Engagement 1",
-        "notes": "<strong>Test 1</strong>",
-        "client_id": "",
-        "created_at": "2021-02-05T19:59:27.104Z",
-    }
+    return dict(ENGAGEMENT_DICT_NO_ARCHIVED)
 
 
 @pytest.fixture
 def engagement_dict_no_created_at():
     """Return an Engagement Dictionary."""
-    return {
-        "id": "7aBB7za9",
-        "name": "Engagement 1",
-        "notes": "<strong>Test 1</strong>",
-        "client_id": "",
-        "archived": "2021-02-05T19:59:27.104Z",
-    }
+    return dict(ENGAGEMENT_DICT_NO_CREATED_AT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engagement_keys():
     """Responsible only for returning the test data."""
     return ["id", "name", "notes", "client_id", "created_at", "archived"]
@@ -87,64 +223,23 @@ def engagement_object_no_created_at():
 @pytest.fixture
 def host_dict():
     """Return a Host dictionary."""
-    return {
-        "target": "1.2.3.4",
-        "board_id": "abcd1234",
-        "eid": "ZaAvk46j",
-        "flagged": True,
-        "hostnames": "host",
-        "id": "No3e25l6",
-        "label": "label",
-        "notes": "Note",
-        "os": "OS",
-        "os_type": "Linux",
-        "out_of_scope": True,
-        "owned": False,
-        "reviewed": True,
-        "shell": True,
-        "thumbs_down": True,
-        "thumbs_up": True,
-        "type": "Unknown",
-    }
+    return dict(HOST_DICT)
 
 
 @pytest.fixture
 def notePage_dict():
     """Return a Note Page dictionary."""
-    return {
-        "id": "1ab5Mqoy",
-        "oid": "46yEw36g",
-        "otype": "e",
-        "title": "Engagement Test Note",
-        "content": "Some text is here.",
-    }
+    return dict(NOTEPAGE_DICT)
 
 
 @pytest.fixture
 def port_dict():
     """Return a Port dictionary."""
-    return {
-        "id": "56VqkKba",
-        "hid": "za4AlEP6",
-        "port": 22,
-        "proto": "tcp",
-        "service": "SSH",
-        "version": "2.3",
-        "status": "Needs Review",
-        "state": "open",
-        "notes": "Some Notes",
-        "checklist": [{"0": "Log In?"}],
-    }
+    # Deep copy, so the nested checklist is not shared between tests.
+    return copy.deepcopy(PORT_DICT)
 
 
 @pytest.fixture
 def scratchpad_dict():
     """Return a Scratchpad dictionary."""
-    return {
-        "id": "1abWR16y",
-        "hid": "za4AlEP6",
-        "title": "README.md",
-        "type": "code",
-        "language": "markdown",
-        "content": "`hash:user``",
-    }
+    return dict(SCRATCHPAD_DICT)
@@ -1,13 +1,44 @@
 #!/usr/bin/env pytest -vs
 """Tests for Host objects in pws-api-wrapper."""
 
+# Standard Python Libraries
+import re
+
 # Third-Party Libraries
 import pytest
 from schema import SchemaError
 import vcr
 
 # Custom Libraries
-from pws_api_wrapper import Host
+from pws_api_wrapper import Host, Port
+
+INIT_VALIDATION_FAILURES = [
+    ("board_id", 4, '"board_id" should be 8 alphanumeric characters'),
+    ("board_id", "asd123", '"board_id" should be 8 alphanumeric characters'),
+    ("board_id", "abcd123!", '"board_id" should be 8 alphanumeric characters'),
+    ("eid", 4, '"eid" should be 8 alphanumeric characters'),
+    ("eid", "asd123", '"eid" should be 8 alphanumeric characters'),
+    ("eid", "abcd123!", '"eid" should be 8 alphanumeric characters'),
+    ("flagged", 1, '"flagged" should be True/False boolean'),
+    ("hostnames", 1, '"hostnames" should be a string'),
+    ("id", 4, '"id" should be 8 alphanumeric characters'),
+    ("id", "asd123", '"id" should be 8 alphanumeric characters'),
+    ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
+    ("id", "abcd1234\n", '"id" should be 8 alphanumeric characters'),
+    ("label", 1, '"label" should be a string'),
+    ("notes", 1, '"notes" should be a string'),
+    ("os", 1, '"os" should be a string'),
+    ("os_type", 1, 'Not a valid "os_type".'),
+    ("os_type", "other", 'Not a valid "os_type".'),
+    ("out_of_scope", 1, '"out_of_scope" should be True/False boolean'),
+    ("owned", 1, '"owned" should be True/False boolean'),
+    ("reviewed", 1, '"reviewed" should be True/False boolean'),
+    ("shell", "1", '"shell" should be True/False boolean'),
+    ("thumbs_down", 2, '"thumbs_down" should be True/False boolean'),
+    ("thumbs_up", 1, '"thumbs_up" should be True/False boolean'),
+    ("type", 1, 'Not a valid "type".'),
+    ("type", "Something", 'Not a valid "type".'),
+]
 
 
 class TestHost:
@@ -17,6 +48,8 @@ class TestHost:
         "target",
         [
             "1.2.3.4",
+            "0.0.0.0",
+            "255.255.255.255",
             "2001:db8:85a3::8a2e:370:7334",
             "2001:db8:85a3:1234:1234:8a2e:370:7334",
         ],
@@ -29,39 +62,61 @@ class TestHost:
 
         assert host.to_dict() == host_dict
 
+    def test_slots(self, host_dict):
+        """Test hosts only accept their declared attributes."""
+        host = Host(**host_dict)
+
+        with pytest.raises(AttributeError):
+            host.test_str = "str"
+
+    def test_init_paths(self, host_dict):
+        """Test the API paths are built from the host's own ids."""
+        host = Host(**host_dict)
+
+        assert host.host_path == "https://pentest.ws/api/v1/hosts/No3e25l6"
+        assert host.engagement_path == "https://pentest.ws/api/v1/e/ZaAvk46j/hosts"
+
+    def test_init_paths_no_id(self, host_dict):
+        """Test a host without an id has no host path."""
+        del host_dict["id"]
+
+        host = Host(**host_dict)
+
+        assert not hasattr(host, "host_path")
+
+    def test_init_paths_no_eid(self):
+        """Test a host without an engagement id has no engagement path."""
+        host = Host(target="1.2.3.4")
+
+        assert not hasattr(host, "engagement_path")
+
+    @pytest.mark.parametrize(
+        "os_type,value",
+        [("Linux", "Linux"), ("question", "question"), ("Unknown", "question")],
+    )
+    def test_canonical_os_type(self, os_type, value):
+        """Test os_type values and display names map to the API value."""
+        assert Host.canonical_os_type(os_type) == value
+
+    @pytest.mark.parametrize(
+        "type,value",
+        [("wifi", "wifi"), ("Access Point", "wifi"), ("Workstation", "desktop")],
+    )
+    def test_canonical_type(self, type, value):
+        """Test type values and display names map to the API value."""
+        assert Host.canonical_type(type) == value
+
     @pytest.mark.parametrize(
         "attribute,value,error_message",
-        [
-            ("board_id", 4, '"board_id" should be 8 alphanumeric characters'),
-            ("board_id", "asd123", '"board_id" should be 8 alphanumeric characters'),
-            ("board_id", "abcd123!", '"board_id" should be 8 alphanumeric characters'),
-            ("eid", 4, '"eid" should be 8 alphanumeric characters'),
-            ("eid", "asd123", '"eid" should be 8 alphanumeric characters'),
-            ("eid", "abcd123!", '"eid" should be 8 alphanumeric characters'),
-            ("flagged", 1, '"flagged" should be True/False boolean'),
-            ("hostnames", 1, '"hostnames" should be a string'),
-            ("id", 4, '"id" should be 8 alphanumeric characters'),
-            ("id", "asd123", '"id" should be 8 alphanumeric characters'),
-            ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
-            ("label", 1, '"label" should be a string'),
-            ("notes", 1, '"notes" should be a string'),
-            ("os", 1, '"os" should be a string'),
-            ("os_type", 1, 'Not a valid "os_type".'),
-            ("os_type", "other", 'Not a valid "os_type".'),
-            ("out_of_scope", 1, '"out_of_scope" should be True/False boolean'),
-            ("owned", 1, '"owned" should be True/False boolean'),
-            ("reviewed", 1, '"reviewed" should be True/False boolean'),
-            ("shell", "1", '"shell" should be True/False boolean'),
-            ("thumbs_down", 2, '"thumbs_down" should be True/False boolean'),
-            ("thumbs_up", 1, '"thumbs_up" should be True/False boolean'),
-            ("type", 1, 'Not a valid "type".'),
-            ("type", "Something", 'Not a valid "type".'),
+        INIT_VALIDATION_FAILURES,
+        ids=[
+            f"{attribute}={value!r}" for attribute, value, _ in INIT_VALIDATION_FAILURES
         ],
     )
     def test_init_validation_fail(self, attribute, value, error_message, host_dict):
         """Test the init validation fails when string value are not strings."""
         host_dict[attribute] = value
-        with pytest.raises(SchemaError, match=error_message):
+        with pytest.raises(SchemaError, match=re.escape(error_message)):
             Host(**host_dict)
 
     @pytest.mark.parametrize(
@@ -76,6 +131,9 @@ class TestHost:
             ("1.2456.1.1"),
             ("1.1.2456.1"),
             ("1.1.1.2456"),
+            ("01.1.1.1"),
+            ("1.1.1."),
+            ("1.1.1.+1"),
             ("test"),
             (""),
             (1),
@@ -108,6 +166,35 @@ class TestHost:
         assert isinstance(host, Host)
         assert host.to_dict() == host_dict
         assert message == "Host 1.2.3.4 (No3e25l6) created."
+        assert host.host_path == "https://pentest.ws/api/v1/hosts/No3e25l6"
+
+    @vcr.use_cassette("tests/vcr_cassettes/host/create-200.yml")
+    def test_bulk_create(self, host_dict):
+        """Test creating hosts concurrently."""
+        # FIXME This should be removed once the API returns it.
+        del host_dict["board_id"]
+        del host_dict["id"]
+
+        messages = Host.bulk_create([Host(**host_dict)])
+
+        assert messages == ["Host 1.2.3.4 (No3e25l6) created."]
+
+    @vcr.use_cassette("tests/vcr_cassettes/host/get-200.yml")
+    def test_bulk_get(self, host_dict):
+        """Test getting hosts concurrently."""
+        hosts = Host.bulk_get(["No3e25l6"])
+
+        assert len(hosts) == 1
+        assert hosts[0].to_dict() == host_dict
+
+    @pytest.mark.parametrize("method", ["create", "delete", "update"])
+    def test_unexpected_status(self, method, host_dict, server_error):
+        """Test an unhandled status code still returns an error message."""
+        host = Host(**host_dict)
+
+        message = getattr(host, method)()
+
+        assert message == "Error: 500 Internal Server Error"
 
     @vcr.use_cassette("tests/vcr_cassettes/host/del-200.yml")
     def test_host_delete_200(self, host_dict):
@@ -158,6 +245,24 @@ class TestHost:
         host = Host.get_all(engagement_object_no_archived.id)
 
         assert len(host) == 3
+        assert all(isinstance(each_host, Host) for each_host in host)
+        assert host[0].host_path == "https://pentest.ws/api/v1/hosts/MoMM4gYo"
+        assert host[0].to_dict()["target"] == "10.10.11.105"
+
+    def test_get_all_404(self, not_found):
+        """Test an API call to get all hosts that returns an error."""
+        with pytest.raises(SystemExit):
+            Host.get_all("abcd1234")
+
+    @vcr.use_cassette("tests/vcr_cassettes/host/get-all.yml")
+    def test_get_all_with_ports(self, engagement_object_no_archived, monkeypatch):
+        """Test getting all hosts for an Engagement with their ports."""
+        monkeypatch.setattr(Port, "get_all", lambda hid: [hid])
+
+        hosts = Host.get_all_with_ports(engagement_object_no_archived.id)
+
+        assert len(hosts) == 3
+        assert all(ports == [host.id] for host, ports in hosts)
 
     @vcr.use_cassette("tests/vcr_cassettes/host/update-200.yml")
     def test_update_200(self, host_dict):
@@ -1,6 +1,10 @@
 #!/usr/bin/env pytest -vs
 """Tests for NotePage objects in pws-api-wrapper."""
 
+# Standard Python Libraries
+import json
+import re
+
 # Third-Party Libraries
 import pytest
 from schema import SchemaError
@@ -9,6 +13,28 @@ import vcr
 # Custom Libraries
 from pws_api_wrapper import NotePage
 
+INIT_VALIDATION_FAILURES = [
+    ("id", 4, '"id" should be 8 alphanumeric characters'),
+    ("id", "asd123", '"id" should be 8 alphanumeric characters'),
+    ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
+    ("oid", 4, '"oid" should be 8 alphanumeric characters'),
+    ("oid", "asd123", '"oid" should be 8 alphanumeric characters'),
+    (
+        "oid",
+        "abcd123!",
+        '"oid" should be 8 alphanumeric characters',
+    ),
+    ("title", "", 'Note Page "title" is required.'),
+    ("title", "!!!", 'Note Page "title" is required.'),
+    ("content", 1, '"contented" should be a string or None.'),
+    (
+        "otype",
+        "green",
+        '"otype" should be one of the following:',
+    ),
+    ("otype", "h", '"otype" should be one of the following:'),
+]
+
 
 class TestNotePage:
     """Tests for the NotePage."""
@@ -43,6 +69,15 @@ class TestNotePage:
         assert isinstance(notePage, NotePage)
         assert message == "Error: Invalid engagements ID"
 
+    @pytest.mark.parametrize("method", ["create", "delete", "update"])
+    def test_unexpected_status(self, method, notePage_dict, server_error):
+        """Test an unhandled status code still returns an error message."""
+        notePage = NotePage(**notePage_dict)
+
+        message = getattr(notePage, method)()
+
+        assert message == "Error: 500 Internal Server Error"
+
     @vcr.use_cassette("tests/vcr_cassettes/notePage/delete-200.yml")
     def test_delete_200(self, notePage_dict):
         """Test an API call to delete a Note Page."""
@@ -71,44 +106,68 @@ class TestNotePage:
         assert isinstance(notepad, NotePage)
         assert notepad.to_dict() == notePage_dict
 
+    def test_get_cached(self, notePage_dict):
+        """Test repeated gets reuse the cached response until it is deleted."""
+        with vcr.use_cassette("tests/vcr_cassettes/notePage/get-200.yml") as cassette:
+            notePage = NotePage.get("1ab5Mqoy")
+            notePage.content = "Unsaved text."
+
+            assert NotePage.get("1ab5Mqoy").to_dict() == notePage_dict
+            assert cassette.play_count == 1
+
+        with vcr.use_cassette("tests/vcr_cassettes/notePage/delete-200.yml"):
+            notePage.delete()
+
+        with vcr.use_cassette("tests/vcr_cassettes/notePage/get-200.yml") as cassette:
+            NotePage.get("1ab5Mqoy")
+            assert cassette.play_count == 1
+
     @vcr.use_cassette("tests/vcr_cassettes/notePage/get-400.yml")
     def test_get_400(self, notePage_dict):
         """Test an API call to fail at getting a Note Page."""
         with pytest.raises(SystemExit):
             NotePage.get("abcd1234")
 
+    def test_slots(self, notePage_dict):
+        """Test note pages only accept their declared attributes."""
+        notePage = NotePage(**notePage_dict)
+
+        with pytest.raises(AttributeError):
+            notePage.test_str = "str"
+
+    def test_init_paths_no_parent(self):
+        """Test a Note Page without an object has no object_path."""
+        notePage = NotePage(title="Test Note")
+
+        assert not hasattr(notePage, "object_path")
+
     def test_init_validation_pass(self, notePage_dict):
         """Test the init validation."""
         notePage = NotePage(**notePage_dict)
 
         assert notePage.to_dict() == notePage_dict
 
+    @pytest.mark.parametrize("otype", ["e", "hosts", "ports"])
+    def test_init_validation_otype(self, otype, notePage_dict):
+        """Test the init validation accepts each object type."""
+        notePage_dict["otype"] = otype
+        notePage = NotePage(**notePage_dict)
+
+        assert notePage.object_path == (
+            f"https://pentest.ws/api/v1/{otype}/46yEw36g/notepages"
+        )
+
     @pytest.mark.parametrize(
         "attribute,value,error_message",
-        [
-            ("id", 4, '"id" should be 8 alphanumeric characters'),
-            ("id", "asd123", '"id" should be 8 alphanumeric characters'),
-            ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
-            ("oid", 4, '"oid" should be 8 alphanumeric characters'),
-            ("oid", "asd123", '"oid" should be 8 alphanumeric characters'),
-            (
-                "oid",
-                "abcd123!",
-                '"oid" should be 8 alphanumeric characters',
-            ),
-            ("title", "", 'Note Page "title" is required.'),
-            ("content", 1, '"contented" should be a string or None.'),
-            (
-                "otype",
-                "green",
-                '"otype" should be one of the following:',
-            ),
+        INIT_VALIDATION_FAILURES,
+        ids=[
+            f"{attribute}={value!r}" for attribute, value, _ in INIT_VALIDATION_FAILURES
         ],
     )
     def test_init_validation_fail(self, attribute, value, error_message, notePage_dict):
         """Test the init validation fails when string value are not strings."""
         notePage_dict[attribute] = value
-        with pytest.raises(SchemaError, match=error_message):
+        with pytest.raises(SchemaError, match=re.escape(error_message)):
             NotePage(**notePage_dict)
 
     @vcr.use_cassette("tests/vcr_cassettes/notePage/update-200.yml")
@@ -124,6 +183,17 @@ class TestNotePage:
         assert notePage.to_dict() == notePage_dict
         assert message == "Note Page Engagement Test Note (1ab5Mqoy) updated."
 
+    @vcr.use_cassette("tests/vcr_cassettes/notePage/update-200.yml")
+    def test_update_data(self, notePage_dict, sent_requests):
+        """Test an update sends the Note Page as JSON encoded data."""
+        NotePage(**notePage_dict).update()
+
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(sent_requests[0].body) == {
+            "content": "Some text is here.",
+            "title": "Engagement Test Note",
+        }
+
     @vcr.use_cassette("tests/vcr_cassettes/notePage/update-400.yml")
     def test_update_400(self, notePage_dict):
         """Test an API call to update a Note Page with missing object."""
@@ -1,6 +1,9 @@
 #!/usr/bin/env pytest -vs
 """Tests for Port objects in pws-api-wrapper."""
 
+# Standard Python Libraries
+import re
+
 # Third-Party Libraries
 import pytest
 from schema import SchemaError
@@ -9,10 +12,47 @@ import vcr
 # Custom Libraries
 from pws_api_wrapper import Port
 
+INIT_VALIDATION_FAILURES = [
+    ("id", 4, '"id" should be 8 alphanumeric characters'),
+    ("id", "abc1234", '"id" should be 8 alphanumeric characters'),
+    ("id", "abcd123$", '"id" should be 8 alphanumeric characters'),
+    ("hid", 4, '"hid" should be 8 alphanumeric characters'),
+    ("hid", "abc1234", '"hid" should be 8 alphanumeric characters'),
+    ("hid", "abcd123$", '"hid" should be 8 alphanumeric characters'),
+    ("port", -1, '"port" should be an intiger between 0 and 65,535.'),
+    ("port", 65536, '"port" should be an intiger between 0 and 65,535.'),
+    ("port", 1.2, '"port" should be an intiger between 0 and 65,535.'),
+    ("port", "a", '"port" should be an intiger between 0 and 65,535.'),
+    ("port", True, '"port" should be an intiger between 0 and 65,535.'),
+    ("proto", "work", '"proto" should be "tcp", "udp", or None'),
+    ("proto", 1, '"proto" should be "tcp", "udp", or None'),
+    ("service", 1, '"service" should be a string'),
+    ("version", 1, '"version" should be a string'),
+    ("status", 1, 'Not a valid "status".'),
+    ("status", "other", 'Not a valid "status".'),
+    ("state", 1, 'Not a valid "state".'),
+    ("state", "other", 'Not a valid "state".'),
+    ("notes", 1, '"notes" should be a string'),
+    ("checklist", "adf", '"checklist" should be a list of dictionaries.'),
+]
+
 
 class TestPort:
     """Tests for the Port Endpoint."""
 
+    def test_slots(self, port_dict):
+        """Test ports only accept their declared attributes."""
+        port = Port(**port_dict)
+
+        with pytest.raises(AttributeError):
+            port.test_str = "str"
+
+    def test_init_paths_no_parent(self):
+        """Test a port without a host id has no host_path."""
+        port = Port(port=22)
+
+        assert not hasattr(port, "host_path")
+
     def test_init_validation_pass(self, port_dict):
         """Test the init validation."""
         port = Port(**port_dict)
@@ -21,33 +61,15 @@ class TestPort:
 
     @pytest.mark.parametrize(
         "attribute,value,error_message",
-        [
-            ("id", 4, '"id" should be 8 alphanumeric characters'),
-            ("id", "abc1234", '"id" should be 8 alphanumeric characters'),
-            ("id", "abcd123$", '"id" should be 8 alphanumeric characters'),
-            ("hid", 4, '"hid" should be 8 alphanumeric characters'),
-            ("hid", "abc1234", '"hid" should be 8 alphanumeric characters'),
-            ("hid", "abcd123$", '"hid" should be 8 alphanumeric characters'),
-            ("port", -1, '"port" should be an intiger between 0 and 65,535.'),
-            ("port", 65536, '"port" should be an intiger between 0 and 65,535.'),
-            ("port", 1.2, '"port" should be an intiger between 0 and 65,535.'),
-            ("port", "a", '"port" should be an intiger between 0 and 65,535.'),
-            ("proto", "work", '"proto" should be "tcp", "udp", or None'),
-            ("proto", 1, '"proto" should be "tcp", "udp", or None'),
-            ("service", 1, '"service" should be a string'),
-            ("version", 1, '"version" should be a string'),
-            ("status", 1, 'Not a valid "status".'),
-            ("status", "other", 'Not a valid "status".'),
-            ("state", 1, 'Not a valid "state".'),
-            ("state", "other", 'Not a valid "state".'),
-            ("notes", 1, '"notes" should be a string'),
-            ("checklist", "adf", '"checklist" should be a list of dictionaries.'),
+        INIT_VALIDATION_FAILURES,
+        ids=[
+            f"{attribute}={value!r}" for attribute, value, _ in INIT_VALIDATION_FAILURES
         ],
     )
     def test_init_validation_fail(self, attribute, value, error_message, port_dict):
         """Test the init validation fails when incorrect values are provided."""
         port_dict[attribute] = value
-        with pytest.raises(SchemaError, match=error_message):
+        with pytest.raises(SchemaError, match=re.escape(error_message)):
             Port(**port_dict)
 
     @vcr.use_cassette("tests/vcr_cassettes/port/create-200.yml")
@@ -81,6 +103,15 @@ class TestPort:
 
         assert message == "Error: Invalid Host ID"
 
+    @pytest.mark.parametrize("method", ["create", "delete", "update"])
+    def test_unexpected_status(self, method, port_dict, server_error):
+        """Test an unhandled status code still returns an error message."""
+        port = Port(**port_dict)
+
+        message = getattr(port, method)()
+
+        assert message == "Error: 500 Internal Server Error"
+
     @vcr.use_cassette("tests/vcr_cassettes/port/del-200.yml")
     def test_port_delete_200(self, port_dict):
         """Test an API call to delete a Port."""
@@ -108,6 +139,23 @@ class TestPort:
         assert isinstance(port, Port)
         assert port.to_dict() == port_dict
 
+    def test_get_cached(self, port_dict):
+        """Test repeated gets reuse the cached response until it is updated."""
+        with vcr.use_cassette("tests/vcr_cassettes/port/get-200.yml") as cassette:
+            port = Port.get("56VqkKba")
+            port.notes = "Unsaved Notes"
+            port.checklist.append({"1": "Unsaved"})
+
+            assert Port.get("56VqkKba").to_dict() == port_dict
+            assert cassette.play_count == 1
+
+        with vcr.use_cassette("tests/vcr_cassettes/port/update-200.yml"):
+            port.update()
+
+        with vcr.use_cassette("tests/vcr_cassettes/port/get-200.yml") as cassette:
+            Port.get("56VqkKba")
+            assert cassette.play_count == 1
+
     @vcr.use_cassette("tests/vcr_cassettes/port/get-400.yml")
     def test_get_400(self):
         """Test an API call to get a port that returns an error."""
@@ -120,6 +168,14 @@ class TestPort:
         ports = Port.get_all(host_dict["id"])
 
         assert len(ports) == 6
+        assert isinstance(ports[0], Port)
+        assert ports[0].port_path == "https://pentest.ws/api/v1/ports/56VqkKba"
+        assert ports[0].host_path == "https://pentest.ws/api/v1/hosts/No3e25l6/ports"
+
+    def test_get_all_404(self, not_found):
+        """Test an API call to get all ports that returns an error."""
+        with pytest.raises(SystemExit):
+            Port.get_all("abcd1234")
 
     @vcr.use_cassette("tests/vcr_cassettes/port/update-200.yml")
     def test_update_200(self, port_dict):
@@ -2,15 +2,32 @@
 """Tests for pws-api-wrapper."""
 
 # Standard Python Libraries
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import sys
 
 # Third-Party Libraries
 import pytest
+import requests
+from schema import Schema, SchemaError, Use
 import vcr
 
 # Custom Libraries
-from pws_api_wrapper import AbstractEndpoint, APIKeyMissingError, Engagement
-from pws_api_wrapper.session import get_api_key
+from pws_api_wrapper import (
+    AbstractEndpoint,
+    APIKeyMissingError,
+    Engagement,
+    EngagementNotFoundError,
+)
+from pws_api_wrapper.cache import ttl_cache
+from pws_api_wrapper.session import (
+    MAX_WORKERS,
+    POOL_MAXSIZE,
+    build_session,
+    get_api_key,
+    session,
+)
+from pws_api_wrapper.validators import quick_validate
 
 
 class TestPWSession:
@@ -22,6 +39,155 @@ class TestPWSession:
         with pytest.raises(APIKeyMissingError):
             get_api_key()
 
+    def test_api_key_read_per_request(self, monkeypatch):
+        """Test the api key is read when a request is prepared."""
+        request = requests.Request("GET", "https://pentest.ws/api/v1/e")
+
+        monkeypatch.setenv("PENTEST_WS_API_KEY", "OtherAPIKey")
+        assert session.prepare_request(request).headers["X-API-KEY"] == "OtherAPIKey"
+
+        monkeypatch.delenv("PENTEST_WS_API_KEY")
+        with pytest.raises(APIKeyMissingError):
+            session.prepare_request(request)
+
+    def test_session_adapter(self):
+        """Test the shared session mounts a pooled, retrying adapter."""
+        adapter = session.get_adapter("https://pentest.ws/api/v1")
+
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+        assert adapter.max_retries.total == 3
+        assert session.headers["Content-Type"] == "application/json"
+        assert session.headers["Connection"] == "keep-alive"
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_session_pool_maxsize(self):
+        """Test the pool can be sized for more concurrent requests."""
+        adapter = build_session(pool_maxsize=32).get_adapter("https://pentest.ws")
+
+        assert POOL_MAXSIZE >= MAX_WORKERS
+        assert adapter._pool_maxsize == 32
+
+
+class TestTTLCache:
+    """Tests for the ttl_cache decorator."""
+
+    def test_cached(self):
+        """Test results are reused until the cache is cleared."""
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def double(value):
+            calls.append(value)
+            return value * 2
+
+        assert double(2) == 4
+        assert double(2) == 4
+        assert calls == [2]
+
+        double.cache_clear()
+
+        assert double(2) == 4
+        assert calls == [2, 2]
+
+    def test_invalidate(self):
+        """Test invalidating one result keeps the others cached."""
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def double(value):
+            calls.append(value)
+            return value * 2
+
+        double(1)
+        double(2)
+        double.cache_invalidate(1)
+        double.cache_invalidate(3)
+        double(1)
+        double(2)
+
+        assert calls == [1, 2, 1]
+
+    def test_expired(self):
+        """Test results are fetched again once they expire."""
+        calls = []
+
+        @ttl_cache(ttl=0)
+        def double(value):
+            calls.append(value)
+            return value * 2
+
+        double(2)
+        double(2)
+
+        assert calls == [2, 2]
+
+    def test_maxsize(self):
+        """Test the least recently used result is dropped when full."""
+        calls = []
+
+        @ttl_cache(ttl=60, maxsize=2)
+        def double(value):
+            calls.append(value)
+            return value * 2
+
+        double(1)
+        double(2)
+        double(1)
+        double(3)
+        double(1)
+        double(2)
+
+        assert calls == [1, 2, 3, 2]
+
+    def test_threads(self):
+        """Test the cache can be used from several threads at once."""
+
+        @ttl_cache(ttl=60, maxsize=4)
+        def double(value):
+            return value * 2
+
+        values = [value % 8 for value in range(20000)]
+        # Switch threads as often as possible to make races likely.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(double, values))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert results == [value * 2 for value in values]
+
+
+class TestQuickValidate:
+    """Tests for the quick_validate helper."""
+
+    schema = Schema({"name": Use(str.strip)})
+    checks = {"name": lambda name: type(name) is str and name == name.strip()}
+
+    def test_checks_pass(self):
+        """Test data passing the checks is returned as a copy."""
+        data = {"name": "a"}
+
+        validated = quick_validate(self.schema, self.checks, frozenset({"name"}), data)
+
+        assert validated == data
+        assert validated is not data
+
+    def test_falls_back_to_schema(self):
+        """Test data failing the checks is validated by the schema."""
+        validated = quick_validate(
+            self.schema, self.checks, frozenset({"name"}), {"name": " a "}
+        )
+
+        assert validated == {"name": "a"}
+
+    @pytest.mark.parametrize("data", [{}, {"name": "a", "other": "b"}])
+    def test_schema_errors(self, data):
+        """Test missing and unknown keys raise the schema's error."""
+        with pytest.raises(SchemaError):
+            quick_validate(self.schema, self.checks, frozenset({"name"}), data)
+
 
 class TestAbstractEndpoint:
     """Tests for the Abstract Endpoint."""
@@ -35,20 +201,48 @@ class TestAbstractEndpoint:
 
     def test_to_dict(self):
         """Test the to_dict functions correctly."""
-        endpoint = AbstractEndpoint
-        setattr(endpoint, "test_str", "str")
-        setattr(
-            endpoint,
-            "datetime",
-            datetime.strptime("2021-02-05T19:59:27.104+0000", "%Y-%m-%dT%H:%M:%S.%f%z"),
-        )
+
+        class Endpoint(AbstractEndpoint):
+            pass
+
+        # A subclass instance, so no attributes are left on AbstractEndpoint.
+        endpoint = Endpoint()
+        endpoint.test_str = "str"
+        endpoint.datetime = datetime(2021, 2, 5, 19, 59, 27, 104000, timezone.utc)
 
         endpoint_dict = {
             "test_str": "str",
             "datetime": "2021-02-05T19:59:27.104Z",
         }
 
-        assert endpoint.to_dict(endpoint) == endpoint_dict
+        assert endpoint.to_dict() == endpoint_dict
+        assert not hasattr(AbstractEndpoint, "test_str")
+
+    def test_to_dict_attributes(self):
+        """Test to_dict walks attributes when no fields are declared."""
+
+        class Endpoint(AbstractEndpoint):
+            pass
+
+        endpoint = Endpoint()
+        endpoint.number = 1
+        endpoint.items = ["a"]
+        endpoint.missing = None
+        endpoint.host_path = "https://pentest.ws/api/v1/hosts"
+
+        assert endpoint.to_dict() == {"number": 1, "items": ["a"]}
+        assert endpoint.to_dict(exclude=frozenset({"items"})) == {"number": 1}
+
+    def test_from_trusted_dict(self):
+        """Test an endpoint is built from a response without validation."""
+
+        class Endpoint(AbstractEndpoint):
+            pass
+
+        endpoint = Endpoint._from_trusted_dict({"number": 1})
+
+        assert isinstance(endpoint, Endpoint)
+        assert endpoint.to_dict() == {"number": 1}
 
 
 class TestEngagement:
@@ -69,6 +263,21 @@ class TestEngagement:
         assert isinstance(engagement, Engagement)
         assert engagement.to_dict() == engagement_dict_no_archived
         assert message == "Engagement Engagement 1 (za4Kz7oy) created."
+        assert engagement.engagement_path == "https://pentest.ws/api/v1/e/za4Kz7oy"
+
+    @vcr.use_cassette("tests/vcr_cassettes/engagement/create-200.yml")
+    def test_engagement_create_headers(
+        self, engagement_dict_no_archived, monkeypatch, sent_requests
+    ):
+        """Test the session headers are sent without being passed per call."""
+        del engagement_dict_no_archived["id"]
+        del engagement_dict_no_archived["created_at"]
+        monkeypatch.setenv("PENTEST_WS_API_KEY", "HeaderAPIKey")
+
+        Engagement(**engagement_dict_no_archived).create()
+
+        assert sent_requests[0].headers["X-API-KEY"] == "HeaderAPIKey"
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
 
     @vcr.use_cassette("tests/vcr_cassettes/engagement/create-400.yml")
     def test_engagement_create_400(self, engagement_dict_no_archived):
@@ -78,7 +287,6 @@ class TestEngagement:
 
         engagement = Engagement(**engagement_dict_no_archived)
 
-        setattr(engagement, "test_str", "str")
         delattr(engagement, "name")
 
         message = engagement.create()
@@ -86,6 +294,17 @@ class TestEngagement:
         assert isinstance(engagement, Engagement)
         assert message == "Error: Missing name"
 
+    @pytest.mark.parametrize("method", ["create", "delete", "update"])
+    def test_engagement_unexpected_status(
+        self, method, engagement_dict_no_archived, server_error
+    ):
+        """Test an unhandled status code still returns an error message."""
+        engagement = Engagement(**engagement_dict_no_archived)
+
+        message = getattr(engagement, method)()
+
+        assert message == "Error: 500 Internal Server Error"
+
     @vcr.use_cassette("tests/vcr_cassettes/engagement/del-200.yml")
     def test_engagement_delete_200(self, engagement_object_no_archived):
         """Test an API call to get an Engagement."""
@@ -120,6 +339,21 @@ class TestEngagement:
         assert isinstance(eid, str)
         assert eid == "7aBB7za9", "The eid should be 7aBB7za9."
 
+    @vcr.use_cassette("tests/vcr_cassettes/engagement/get-all.yml")
+    def test_engagement_get_eid_not_found(self):
+        """Test looking up an Engagement name that does not exist."""
+        with pytest.raises(EngagementNotFoundError):
+            Engagement.get_eid("Engagement 3")
+
+    def test_engagement_get_eid_cached(self):
+        """Test repeated lookups reuse the cached list of Engagements."""
+        with vcr.use_cassette("tests/vcr_cassettes/engagement/get-all.yml") as cassette:
+            Engagement.get_eid("Engagement 1")
+            eid = Engagement.get_eid("Engagement 1")
+
+        assert eid == "7aBB7za9", "The eid should be 7aBB7za9."
+        assert cassette.play_count == 1
+
     @vcr.use_cassette("tests/vcr_cassettes/engagement/get-all.yml")
     def test_engagement_get_all(self):
         """Test an API call to get all Engagement."""
@@ -128,6 +362,17 @@ class TestEngagement:
         assert isinstance(engagements, list)
         assert len(engagements) == 2, "The length should be 2."
 
+    def test_engagement_get_all_copied(self):
+        """Test changing the Engagements returned leaves the cache intact."""
+        with vcr.use_cassette("tests/vcr_cassettes/engagement/get-all.yml") as cassette:
+            engagements = Engagement.get_all()
+            engagements[0]["name"] = "Renamed"
+            engagements.clear()
+
+            assert len(Engagement.get_all()) == 2, "The length should be 2."
+            assert Engagement.get_eid("Engagement 1") == "7aBB7za9"
+            assert cassette.play_count == 1
+
     def test_engagement_to_dict_no_archived(
         self,
         engagement_dict_no_archived,
@@ -138,6 +383,32 @@ class TestEngagement:
         assert isinstance(engagement_object_no_archived, Engagement)
         assert engagement_object_no_archived.to_dict() == engagement_dict_no_archived
 
+    def test_engagement_slots(self, engagement_object_no_archived):
+        """Tests engagements only accept their declared attributes."""
+        with pytest.raises(AttributeError):
+            engagement_object_no_archived.test_str = "str"
+
+    def test_engagement_to_dict_exclude(self, engagement_object_no_archived):
+        """Tests excluded attributes are left out of the dictionary."""
+        engagement_object_no_archived.archived = ""
+
+        assert engagement_object_no_archived.to_dict(
+            exclude=frozenset({"id", "created_at"})
+        ) == {
+            "name": "Engagement 1",
+            "notes": "<strong>Test 1</strong>",
+            "client_id": "",
+            "archived": "",
+        }
+
+    def test_engagement_to_dict_whole_seconds(self):
+        """Tests a timestamp without milliseconds keeps all three digits."""
+        engagement = Engagement(
+            name="Engagement 1", created_at="2021-02-05T19:59:27.000Z"
+        )
+
+        assert engagement.to_dict()["created_at"] == "2021-02-05T19:59:27.000Z"
+
     def test_engagement_to_dict_no_created_at(
         self,
         engagement_dict_no_created_at,
@@ -1,6 +1,9 @@
 #!/usr/bin/env pytest -vs
 """Tests for Scratchpad objects in pws-api-wrapper."""
 
+# Standard Python Libraries
+import re
+
 # Third-Party Libraries
 import pytest
 from schema import SchemaError
@@ -9,6 +12,21 @@ import vcr
 # Custom Libraries
 from pws_api_wrapper import Scratchpad
 
+INIT_VALIDATION_FAILURES = [
+    ("id", 4, '"id" should be 8 alphanumeric characters'),
+    ("id", "asd123", '"id" should be 8 alphanumeric characters'),
+    ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
+    ("hid", 4, '"hid" should be 8 alphanumeric characters'),
+    ("hid", "asd123", '"hid" should be 8 alphanumeric characters'),
+    ("hid", "abcd123!", '"hid" should be 8 alphanumeric characters'),
+    ("title", "", 'Scratchpad "title" is required.'),
+    ("title", "!!!", 'Scratchpad "title" is required.'),
+    ("language", "green", 'language" should be None or one of the following:'),
+    ("content", 1, '"contented" should be a string or None.'),
+    ("type", "green", '"type" should be None or one of the following:'),
+    ("type", 1, '"type" should be None or one of the following:'),
+]
+
 
 class TestScratchpad:
     """Tests for the Scratchpad."""
@@ -43,6 +61,15 @@ class TestScratchpad:
         assert isinstance(scratchpad, Scratchpad)
         assert message == "Error: Invalid Host ID"
 
+    @pytest.mark.parametrize("method", ["create", "delete", "update"])
+    def test_unexpected_status(self, method, scratchpad_dict, server_error):
+        """Test an unhandled status code still returns an error message."""
+        scratchpad = Scratchpad(**scratchpad_dict)
+
+        message = getattr(scratchpad, method)()
+
+        assert message == "Error: 500 Internal Server Error"
+
     @vcr.use_cassette("tests/vcr_cassettes/scratchpad/del-200.yml")
     def test_scratchpad_delete_200(self, scratchpad_dict):
         """Test an API call to delete a Scratchpad."""
@@ -70,18 +97,50 @@ class TestScratchpad:
         assert isinstance(scratchpad, Scratchpad)
         assert scratchpad.to_dict() == scratchpad_dict
 
+    @vcr.use_cassette("tests/vcr_cassettes/scratchpad/get-200.yml")
+    def test_bulk_get(self, scratchpad_dict):
+        """Test getting scratchpads concurrently."""
+        scratchpads = Scratchpad.bulk_get(["1abWR16y"])
+
+        assert len(scratchpads) == 1
+        assert scratchpads[0].to_dict() == scratchpad_dict
+
     @vcr.use_cassette("tests/vcr_cassettes/scratchpad/get-400.yml")
     def test_get_400(self):
         """Test an API call to get a scratchpad that returns an error."""
         with pytest.raises(SystemExit):
             Scratchpad.get("abcd1234")
 
+    def test_get_all_404(self, not_found):
+        """Test an API call to get all scratchpads that returns an error."""
+        with pytest.raises(SystemExit):
+            Scratchpad.get_all("abcd1234")
+
     @vcr.use_cassette("tests/vcr_cassettes/scratchpad/get-all-200.yml")
     def test_get_call(self):
         """Test an API call to get all scratchpads for a Host."""
         scratchpads = Scratchpad.get_all("za4AlEP6")
 
         assert len(scratchpads) == 3
+        assert isinstance(scratchpads[0], Scratchpad)
+        assert (
+            scratchpads[0].scratchpad_path
+            == "https://pentest.ws/api/v1/scratchpads/1abWR16y"
+        )
+        assert scratchpads[0].title == "README.md"
+
+    def test_init_paths_no_parent(self):
+        """Test a scratchpad without a host id has no host_path."""
+        scratchpad = Scratchpad(title="Test")
+
+        assert not hasattr(scratchpad, "host_path")
+
+    def test_slots(self, scratchpad_dict):
+        """Test scratchpads only accept their declared attributes."""
+        scratchpad = Scratchpad(**scratchpad_dict)
+
+        with pytest.raises(AttributeError):
+            scratchpad.test_str = "str"
 
     def test_init_validation_pass(self, scratchpad_dict):
         """Test the init validation."""
@@ -91,21 +150,9 @@ class TestScratchpad:
 
     @pytest.mark.parametrize(
         "attribute,value,error_message",
-        [
-            ("id", 4, '"id" should be 8 alphanumeric characters'),
-            ("id", "asd123", '"id" should be 8 alphanumeric characters'),
-            ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
-            ("hid", 4, '"hid" should be 8 alphanumeric characters'),
-            ("hid", "asd123", '"hid" should be 8 alphanumeric characters'),
-            ("hid", "abcd123!", '"hid" should be 8 alphanumeric characters'),
-            ("title", "", 'Scratchpad "title" is required.'),
-            ("language", "green", 'language" should be None or one of the following:'),
-            ("id", 4, '"id" should be 8 alphanumeric characters'),
-            ("id", "asd123", '"id" should be 8 alphanumeric characters'),
-            ("id", "abcd123!", '"id" should be 8 alphanumeric characters'),
-            ("content", 1, '"contented" should be a string or None.'),
-            ("type", "green", '"type" should be None or one of the following:'),
-            ("type", 1, '"type" should be None or one of the following:'),
+        INIT_VALIDATION_FAILURES,
+        ids=[
+            f"{attribute}={value!r}" for attribute, value, _ in INIT_VALIDATION_FAILURES
         ],
     )
     def test_init_validation_fail(
@@ -113,7 +160,7 @@ class TestScratchpad:
     ):
         """Test the init validation fails when string value are not strings."""
         scratchpad_dict[attribute] = value
-        with pytest.raises(SchemaError, match=error_message):
+        with pytest.raises(SchemaError, match=re.escape(error_message)):
             Scratchpad(**scratchpad_dict)
 
     @vcr.use_cassette("tests/vcr_cassettes/scratchpad/update-200.yml")